@@ -0,0 +1,38 @@
+"""
+Shared lazy Anthropic client for AI disambiguation and classification.
+
+The SDK import alone pulls in httpx/pydantic (~50ms cold) and each client
+owns a connection pool, so the import happens once on first use and clients
+are cached per API key instead of being rebuilt on every call.
+"""
+from typing import Dict, List
+
+from pipeline.config import ANTHROPIC_API_KEY
+
+_clients: Dict[str, object] = {}
+_async_clients: Dict[str, object] = {}
+
+
+def get_client(api_key: str = ANTHROPIC_API_KEY):
+    """Return a cached Anthropic client for this API key, creating it lazily."""
+    client = _clients.get(api_key)
+    if client is None:
+        import anthropic
+
+        client = _clients[api_key] = anthropic.Anthropic(api_key=api_key)
+    return client
+
+
+def get_async_client(api_key: str = ANTHROPIC_API_KEY):
+    """Return a cached AsyncAnthropic client for this API key, creating it lazily."""
+    client = _async_clients.get(api_key)
+    if client is None:
+        import anthropic
+
+        client = _async_clients[api_key] = anthropic.AsyncAnthropic(api_key=api_key)
+    return client
+
+
+def cached_system_block(text: str) -> List[Dict]:
+    """Wrap a static system prompt for Anthropic's ephemeral prompt caching."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
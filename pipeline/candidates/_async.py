@@ -0,0 +1,120 @@
+"""
+Async variants of the candidate-source fetches using httpx with HTTP/2.
+
+All the per-location requests (ProPublica rosters + FEC candidate pages)
+multiplex over one connection per host instead of occupying a thread each.
+Callers get a plain sync entry point, fetch_all(), so merge.py and scripts
+never need to own an event loop; if httpx isn't installed this falls back
+to the thread-based fetch_all_sources.
+"""
+import asyncio
+from typing import Dict, List
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  # httpx needs the h2 package for HTTP/2
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+from pipeline.candidates import fec, merge, propublica
+from pipeline.config import FEC_API_KEY, PROPUBLICA_API_KEY
+
+
+async def _fec_candidates(
+    client: "httpx.AsyncClient",
+    state: str,
+    office: str,
+    district: str = None,
+    election_year: int = 2026,
+    api_key: str = FEC_API_KEY,
+) -> List[Dict]:
+    """Async equivalent of fec.get_candidates_by_state_and_office."""
+    if not api_key:
+        raise ValueError("FEC_API_KEY not set.")
+
+    params = fec._build_params(state, office, district, election_year, api_key)
+    url = f"{fec.BASE_URL}/candidates/"
+
+    async def fetch_page(page: int) -> Dict:
+        resp = await client.get(url, params=dict(params, page=page))
+        resp.raise_for_status()
+        return resp.json()
+
+    # Page 1 tells us the total; the rest are gathered concurrently in order
+    first = await fetch_page(1)
+    pages = [first]
+
+    total_pages = first.get("pagination", {}).get("pages", 1)
+    if total_pages > 1:
+        pages.extend(
+            await asyncio.gather(*(fetch_page(p) for p in range(2, total_pages + 1)))
+        )
+
+    return fec._parse_candidates(pages, state, office)
+
+
+async def _propublica_members(
+    client: "httpx.AsyncClient",
+    state: str,
+    chamber: str,
+    api_key: str = PROPUBLICA_API_KEY,
+) -> List[Dict]:
+    """Async equivalent of propublica.get_members_by_state."""
+    if not api_key:
+        raise ValueError("PROPUBLICA_API_KEY not set.")
+
+    url = f"{propublica.BASE_URL}/members/{chamber}/{state}/current.json"
+    resp = await client.get(url, headers={"X-API-Key": api_key})
+    resp.raise_for_status()
+
+    return propublica._parse_members(resp.json(), state, chamber)
+
+
+async def _propublica_house_member(
+    client: "httpx.AsyncClient",
+    state: str,
+    district: str,
+    api_key: str = PROPUBLICA_API_KEY,
+) -> List[Dict]:
+    """Async equivalent of propublica.get_house_member_by_district."""
+    all_house = await _propublica_members(client, state, "house", api_key)
+    return [m for m in all_house if str(m.get("district", "")) == str(district)]
+
+
+async def _fetch_all(state: str, district: str = None) -> List[Dict]:
+    async with httpx.AsyncClient(http2=_HTTP2, timeout=10) as client:
+        tasks = [
+            _propublica_members(client, state, "senate"),
+            _fec_candidates(client, state, "S"),
+        ]
+        if district:
+            tasks.append(_propublica_house_member(client, state, district))
+            tasks.append(_fec_candidates(client, state, "H", district=district))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # One source being down shouldn't sink the others
+    candidate_lists = [r for r in results if not isinstance(r, BaseException)]
+    return merge.merge_candidate_lists(*candidate_lists)
+
+
+def fetch_all(state: str, district: str = None) -> List[Dict]:
+    """
+    Fetch candidates from all sources concurrently over HTTP/2 and merge them.
+
+    Args:
+        state: Two-letter state abbreviation
+        district: Congressional district number (optional, for House)
+
+    Returns:
+        Deduplicated list of candidates from all sources
+    """
+    if httpx is None:
+        return merge.fetch_all_sources(state, district)
+
+    return asyncio.run(_fetch_all(state, district))
@@ -5,14 +5,22 @@ Converts a zip code into political divisions (congressional district, state, etc
 Note: The Representatives endpoint was discontinued March 2025.
 We use divisionsByAddress to get OCD-IDs, then look up candidates from other sources.
 """
-import requests
+import re
 from typing import Dict, List, Optional
 
 from pipeline.config import GOOGLE_CIVIC_API_KEY
+from pipeline.candidates.session import SESSION
 
 
 DIVISIONS_URL = "https://www.googleapis.com/civicinfo/v2/divisions"
 
+# Pulls state and congressional district out of an OCD-ID like
+# "ocd-division/country:us/state:ca/cd:12" in one scan instead of
+# splitting and checking every path segment.
+_OCD_RE = re.compile(
+    r"state:(?P<state>[a-z]{2})(?:/(?:cd|congressional_district):(?P<cd>\w+))?"
+)
+
 
 def get_divisions_by_address(
     address: str,
@@ -39,7 +47,7 @@ def get_divisions_by_address(
     # even though representative data is gone.
 
     # Alternative approach: use the OCD-ID lookup
-    resp = requests.get(
+    resp = SESSION.get(
         "https://www.googleapis.com/civicinfo/v2/representatives",
         params={"address": address, "key": api_key},
         timeout=10,
@@ -83,19 +91,15 @@ def extract_district_info(divisions: Dict) -> Dict:
     }
 
     for ocd_id in divisions:
-        parts = ocd_id.split("/")
-
-        for part in parts:
-            if part.startswith("state:"):
-                result["state_abbrev"] = part.split(":")[1].upper()
-                result["state"] = divisions[ocd_id].get("name", "")
-
-            if part.startswith("cd:") or "congressional_district" in part:
-                try:
-                    district_num = part.split(":")[-1]
-                    result["congressional_district"] = district_num
-                except (ValueError, IndexError):
-                    pass
+        match = _OCD_RE.search(ocd_id)
+        if not match:
+            continue
+
+        result["state_abbrev"] = match.group("state").upper()
+        result["state"] = divisions[ocd_id].get("name", "")
+
+        if match.group("cd"):
+            result["congressional_district"] = match.group("cd")
 
     return result
 
@@ -3,14 +3,77 @@ FEC API - Federal Election Commission candidate data.
 Returns all filed candidates for federal races, including challengers.
 https://api.open.fec.gov/developers/
 """
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 from pipeline.config import FEC_API_KEY
+from pipeline.candidates.session import SESSION
 
 
 BASE_URL = "https://api.open.fec.gov/v1"
 
+MAX_PAGE_WORKERS = 8  # Concurrent page fetches; stays well under FEC rate limits
+
+PER_PAGE = 100  # FEC's maximum page size: fewest round-trips per listing
+
+
+def _fetch_page(params: Dict, page: int) -> Dict:
+    """Fetch a single page of FEC candidate results."""
+    resp = SESSION.get(
+        f"{BASE_URL}/candidates/",
+        params=dict(params, page=page),
+        timeout=10,
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _build_params(
+    state: str,
+    office: str,
+    district: str,
+    election_year: int,
+    api_key: str,
+) -> Dict:
+    """Build the candidate-search query params shared by sync and async fetches."""
+    params = {
+        "api_key": api_key,
+        "state": state,
+        "office": office,
+        "election_year": election_year,
+        "is_active_candidate": True,
+        "sort": "name",
+        "per_page": PER_PAGE,
+    }
+
+    if district and office == "H":
+        params["district"] = district.zfill(2)  # FEC uses 2-digit district codes
+
+    return params
+
+
+def _parse_candidates(pages: List[Dict], state: str, office: str) -> List[Dict]:
+    """Flatten page payloads into the pipeline's candidate dict format."""
+    # Hot parse loop: hoist the invariants and method lookups out of it
+    office_name = "U.S. Senate" if office == "S" else "U.S. House"
+    candidates = []
+    append = candidates.append
+
+    for data in pages:
+        for c in data.get("results", []):
+            append({
+                "name": c.get("name", ""),
+                "party": _normalize_party(c.get("party", "")),
+                "state": state,
+                "district": c.get("district", ""),
+                "office": office_name,
+                "incumbent": c.get("incumbent_challenge", "") == "I",
+                "fec_id": c.get("candidate_id", ""),
+                "other_names": [],
+            })
+
+    return candidates
+
 
 def get_candidates_by_state_and_office(
     state: str,
@@ -35,68 +98,36 @@ def get_candidates_by_state_and_office(
     if not api_key:
         raise ValueError("FEC_API_KEY not set.")
 
-    params = {
-        "api_key": api_key,
-        "state": state,
-        "office": office,
-        "election_year": election_year,
-        "is_active_candidate": True,
-        "sort": "name",
-        "per_page": 100,
-    }
-
-    if district and office == "H":
-        params["district"] = district.zfill(2)  # FEC uses 2-digit district codes
+    params = _build_params(state, office, district, election_year, api_key)
 
-    candidates = []
-    page = 1
-
-    while True:
-        params["page"] = page
-        resp = requests.get(
-            f"{BASE_URL}/candidates/",
-            params=params,
-            timeout=10,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    # Fetch page 1 to learn the total page count, then pull the remaining
+    # pages concurrently (each fetch is network-latency-bound).
+    first = _fetch_page(params, 1)
+    pages = [first]
 
-        results = data.get("results", [])
-        if not results:
-            break
+    total_pages = first.get("pagination", {}).get("pages", 1)
+    if total_pages > 1:
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as pool:
+            pages.extend(
+                pool.map(lambda p: _fetch_page(params, p), range(2, total_pages + 1))
+            )
 
-        for c in results:
-            candidates.append({
-                "name": c.get("name", ""),
-                "party": _normalize_party(c.get("party", "")),
-                "state": state,
-                "district": c.get("district", ""),
-                "office": "U.S. Senate" if office == "S" else "U.S. House",
-                "incumbent": c.get("incumbent_challenge", "") == "I",
-                "fec_id": c.get("candidate_id", ""),
-                "other_names": [],
-            })
+    return _parse_candidates(pages, state, office)
 
-        # Check for more pages
-        pagination = data.get("pagination", {})
-        if page >= pagination.get("pages", 1):
-            break
-        page += 1
 
-    return candidates
+_PARTY_CODES = {
+    "DEM": "D",
+    "REP": "R",
+    "LIB": "L",
+    "GRE": "G",
+    "IND": "I",
+    "CON": "C",
+}
 
 
 def _normalize_party(party_code: str) -> str:
     """Normalize FEC party codes to common abbreviations."""
-    mapping = {
-        "DEM": "D",
-        "REP": "R",
-        "LIB": "L",
-        "GRE": "G",
-        "IND": "I",
-        "CON": "C",
-    }
-    return mapping.get(party_code.upper(), party_code)
+    return _PARTY_CODES.get(party_code.upper(), party_code)
 
 
 def get_all_candidates_for_location(
@@ -2,8 +2,10 @@
 Merge candidate data from multiple sources (ProPublica + FEC) into a unified list.
 Deduplicates incumbents that appear in both sources.
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
+from pipeline.candidates import fec, propublica
 from pipeline.crossref.normalize import normalize_name
 
 
@@ -17,7 +19,11 @@ def merge_candidate_lists(*candidate_lists: List[Dict]) -> List[Dict]:
     Returns:
         Deduplicated list of candidates
     """
-    seen = {}  # key: (normalized_name, state, office) -> candidate dict
+    # Block candidates by (state, office) so comparison work is confined to a
+    # small bucket instead of the full national list. Within a block, dedup
+    # is by normalized name.
+    blocks: Dict[tuple, Dict[str, Dict]] = {}
+    merged: List[Dict] = []
 
     for clist in candidate_lists:
         for candidate in clist:
@@ -25,13 +31,19 @@ def merge_candidate_lists(*candidate_lists: List[Dict]) -> List[Dict]:
             state = candidate.get("state", "").upper()
             office = candidate.get("office", "")
 
-            key = (name_norm, state, office)
-
-            if key not in seen:
-                seen[key] = candidate.copy()
+            block = blocks.setdefault((state, office), {})
+            existing = block.get(name_norm)
+
+            if existing is None:
+                entry = candidate.copy()
+                entry["_name_norm"] = name_norm  # Reused by build_candidate_id
+                # Alternate names accumulate in a set; materialized to a
+                # list once after the merge loop
+                entry["_other_names"] = set(entry.get("other_names", []))
+                block[name_norm] = entry
+                merged.append(entry)
             else:
                 # Merge: prefer data from the source that has more fields
-                existing = seen[key]
 
                 # Fill in missing fields from new source
                 if not existing.get("fec_id") and candidate.get("fec_id"):
@@ -42,12 +54,68 @@ def merge_candidate_lists(*candidate_lists: List[Dict]) -> List[Dict]:
                     existing["district"] = candidate["district"]
 
                 # Collect alternate names
-                other_names = set(existing.get("other_names", []))
                 if candidate.get("name") != existing.get("name"):
-                    other_names.add(candidate["name"])
-                existing["other_names"] = list(other_names)
+                    existing["_other_names"].add(candidate["name"])
+
+    for entry in merged:
+        entry["other_names"] = list(entry.pop("_other_names"))
+
+    return merged
+
+
+def fetch_all_sources(state: str, district: str = None) -> List[Dict]:
+    """
+    Fetch candidates from ProPublica and FEC concurrently and merge them.
+
+    Each source call is network-bound, so the four requests run in parallel.
+    Results are merged in submission order, keeping ProPublica's cleaner
+    incumbent records as the preferred data (same precedence as serial calls).
+
+    Args:
+        state: Two-letter state abbreviation
+        district: Congressional district number (optional, for House)
 
-    return list(seen.values())
+    Returns:
+        Deduplicated list of candidates from all sources
+    """
+    tasks = [
+        lambda: propublica.get_members_by_state(state, "senate"),
+        lambda: fec.get_candidates_by_state_and_office(state, "S"),
+    ]
+    if district:
+        tasks.append(lambda: propublica.get_house_member_by_district(state, district))
+        tasks.append(
+            lambda: fec.get_candidates_by_state_and_office(state, "H", district=district)
+        )
+
+    candidate_lists = []
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = [pool.submit(task) for task in tasks]
+        for future in futures:
+            try:
+                candidate_lists.append(future.result())
+            except Exception:
+                pass  # One source being down shouldn't sink the others
+
+    return merge_candidate_lists(*candidate_lists)
+
+
+def build_candidate_key(candidate: Dict) -> str:
+    """
+    Build the internal "name|state|office" key used to join candidates with
+    crossref and classification results.
+
+    Cached on the dict like _id/_name_norm: crossref builds the key once per
+    candidate and publish builds it again, so the f-string and its two dict
+    gets only run on the first call.
+    """
+    cached = candidate.get("_key")
+    if cached:
+        return cached
+
+    key = f"{candidate['name']}|{candidate.get('state', '')}|{candidate.get('office', '')}"
+    candidate["_key"] = key
+    return key
 
 
 def build_candidate_id(candidate: Dict) -> str:
@@ -60,16 +128,32 @@ def build_candidate_id(candidate: Dict) -> str:
     Returns:
         URL-safe string ID like "ca-22-jane-smith"
     """
+    # Both publishers build the id for every candidate, so cache it on the
+    # dict the same way _name_norm is cached below - the second caller gets
+    # the stored string instead of redoing the slug work.
+    cached = candidate.get("_id")
+    if cached:
+        return cached
+
     state = candidate.get("state", "xx").lower()
     district = candidate.get("district", "")
-    name = normalize_name(candidate.get("name", "unknown"))
+
+    # Candidates that went through merge_candidate_lists carry _name_norm
+    # already; compute and cache it for anything else so repeated ID builds
+    # (publish writes candidates.json and connections.json) normalize once.
+    name = candidate.get("_name_norm")
+    if not name:
+        name = candidate["_name_norm"] = normalize_name(candidate.get("name", "unknown"))
 
     # Replace spaces with hyphens
     name_slug = name.replace(" ", "-")
 
     if candidate.get("office", "").lower() == "u.s. senate":
-        return f"{state}-senate-{name_slug}"
+        cid = f"{state}-senate-{name_slug}"
     elif district:
-        return f"{state}-{district}-{name_slug}"
+        cid = f"{state}-{district}-{name_slug}"
     else:
-        return f"{state}-{name_slug}"
+        cid = f"{state}-{name_slug}"
+
+    candidate["_id"] = cid
+    return cid
@@ -3,10 +3,10 @@ ProPublica Congress API - free API for current federal legislators.
 Returns members of Congress by state/district.
 https://www.propublica.org/datastore/api/propublica-congress-api
 """
-import requests
 from typing import Dict, List
 
 from pipeline.config import PROPUBLICA_API_KEY
+from pipeline.candidates.session import SESSION
 
 
 BASE_URL = "https://api.propublica.org/congress/v1"
@@ -32,14 +32,19 @@ def get_members_by_state(
         raise ValueError("PROPUBLICA_API_KEY not set.")
 
     url = f"{BASE_URL}/members/{chamber}/{state}/current.json"
-    resp = requests.get(
+    resp = SESSION.get(
         url,
         headers={"X-API-Key": api_key},
         timeout=10,
     )
     resp.raise_for_status()
-    data = resp.json()
 
+    return _parse_members(resp.json(), state, chamber)
+
+
+def _parse_members(data: Dict, state: str, chamber: str) -> List[Dict]:
+    """Convert a members payload into the pipeline's candidate dict format."""
+    office = "U.S. Senate" if chamber == "senate" else "U.S. House"
     members = []
     for member in data.get("results", []):
         members.append({
@@ -47,7 +52,7 @@ def get_members_by_state(
             "party": member.get("party", ""),
             "state": state,
             "district": member.get("district", ""),
-            "office": "U.S. Senate" if chamber == "senate" else "U.S. House",
+            "office": office,
             "incumbent": True,
             "propublica_id": member.get("id", ""),
             "other_names": [],
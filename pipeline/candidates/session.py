@@ -0,0 +1,48 @@
+"""
+Shared HTTP session for the candidate API clients.
+Connection pooling + keep-alive avoids a fresh TCP/TLS handshake per request,
+which matters most for FEC's paginated pulls against a single host.
+
+Responses are also cached on disk (24h expiry): candidate lists and division
+lookups are effectively static within a pipeline run, so warm runs skip the
+network entirely.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from pipeline.config import CACHE_DIR
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None  # Cache is an optimization; plain Session still works
+
+
+def _build_session() -> requests.Session:
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(
+            cache_name=str(CACHE_DIR / "http_cache"),
+            backend="sqlite",
+            expire_after=86400,  # 24 hours
+            allowable_methods=("GET",),
+            cache_control=True,
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = "know-before-you-vote/1.0 (data pipeline)"
+    return session
+
+
+# Module-level singleton shared by fec.py, propublica.py, and civic_api.py.
+SESSION = _build_session()
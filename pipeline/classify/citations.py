@@ -2,6 +2,7 @@
 Generate structured citations with links to primary source documents.
 Every displayed connection must trace back to a verifiable public record.
 """
+import re
 from typing import Dict, List, Optional
 
 
@@ -21,6 +22,21 @@ DOJ_BASE_URLS = {
     "DS12": "https://www.justice.gov/epstein/dataset-12",
 }
 
+# One compiled alternation over the dataset keys beats scanning the id with
+# 12 separate substring checks per citation.
+_DOJ_DS_RE = re.compile(r"DS(?:0[1-9]|1[0-2])")
+
+# Evidence description keywords -> human-readable source type, checked in
+# priority order (so "flight" beats "email" within one description).
+_SOURCE_TYPE_KEYWORDS = (
+    (("flight",), "flight logs"),
+    (("email",), "email correspondence"),
+    (("donation", "fec", "campaign"), "campaign finance records"),
+    (("testimony", "victim"), "testimony"),
+    (("phone",), "phone records"),
+    (("photo",), "photographs"),
+)
+
 
 def build_document_url(document_id: str, source_db: str) -> Optional[str]:
     """
@@ -37,10 +53,9 @@ def build_document_url(document_id: str, source_db: str) -> Optional[str]:
         return None
 
     # Try to match DOJ dataset pattern (e.g., "DOJ-DS10-00234")
-    doc_upper = document_id.upper()
-    for ds_key, base_url in DOJ_BASE_URLS.items():
-        if ds_key in doc_upper:
-            return f"{base_url}#{document_id}"
+    match = _DOJ_DS_RE.search(document_id.upper())
+    if match:
+        return f"{DOJ_BASE_URLS[match.group(0)]}#{document_id}"
 
     # For LMSBAND source, documents come from DOJ datasets 8-12
     if source_db == "lmsband":
@@ -76,8 +91,10 @@ def generate_citation(
     Returns:
         Structured citation dict ready for frontend display
     """
-    # Build evidence items with source links
+    # Single pass over evidence: build the citation items and bucket the
+    # source types for the summary sentence at the same time.
     evidence_items = []
+    source_types = set()
     for ev in evidence:
         doc_id = ev.get("document_id", "")
         source_db = ev.get("source_db", "")
@@ -87,26 +104,15 @@ def generate_citation(
             "source_db": source_db,
             "document_id": doc_id,
             "document_url": doc_url,
-            "relevant_text": ev.get("raw_text", ev.get("description", ""))[:500],
+            "relevant_text": ev.get("raw_text", ev.get("description", "")),
             "what_it_shows": ev.get("description", "Document mentions this individual"),
         })
 
-    # Generate summary sentence
-    source_types = set()
-    for ev in evidence:
         desc = ev.get("description", "").lower()
-        if "flight" in desc:
-            source_types.add("flight logs")
-        elif "email" in desc:
-            source_types.add("email correspondence")
-        elif "donation" in desc or "fec" in desc or "campaign" in desc:
-            source_types.add("campaign finance records")
-        elif "testimony" in desc or "victim" in desc:
-            source_types.add("testimony")
-        elif "phone" in desc:
-            source_types.add("phone records")
-        elif "photo" in desc:
-            source_types.add("photographs")
+        for keywords, label in _SOURCE_TYPE_KEYWORDS:
+            if any(kw in desc for kw in keywords):
+                source_types.add(label)
+                break
         else:
             source_types.add("documents")
 
@@ -124,6 +130,18 @@ def generate_citation(
     }
 
 
+# The searched-databases list is identical for every clean citation; a shared
+# tuple (serialized as a JSON array) skips one list allocation per clean
+# candidate, and clean candidates are the overwhelming majority.
+_DATABASES_SEARCHED = (
+    "DOJ Epstein Library",
+    "Epstein Doc Explorer (email corpus)",
+    "LMSBAND (DOJ Datasets 8-12)",
+    "SvetimFM Entity Analysis",
+    "phelix001 Epstein Network",
+)
+
+
 def generate_clean_citation(candidate_name: str) -> Dict:
     """
     Generate a citation for a candidate with NO documented connections.
@@ -143,11 +161,5 @@ def generate_clean_citation(candidate_name: str) -> Dict:
         "num_sources": 0,
         "evidence": [],
         "caveat": None,
-        "databases_searched": [
-            "DOJ Epstein Library",
-            "Epstein Doc Explorer (email corpus)",
-            "LMSBAND (DOJ Datasets 8-12)",
-            "SvetimFM Entity Analysis",
-            "phelix001 Epstein Network",
-        ],
+        "databases_searched": _DATABASES_SEARCHED,
     }
@@ -5,21 +5,15 @@ Categorizes verified connections as Direct, Contact, Financial, or Institutional
 CRITICAL: Classification is based ONLY on what documents show, never on inference.
 Flying on the plane without documented illegal activity = "Contact", not "Direct".
 """
-import json
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from pipeline.config import ANTHROPIC_API_KEY, CONNECTION_LEVELS
+import orjson
 
+from pipeline.anthropic_client import cached_system_block, get_client
+from pipeline.config import ANTHROPIC_API_KEY, CONNECTION_LEVELS_SET
 
-CLASSIFICATION_PROMPT = """You are classifying the nature of a connection between a political figure and the Epstein network based ONLY on documentary evidence.
 
-PERSON: {person_name}
-OFFICE: {office}
-
-DOCUMENTARY EVIDENCE:
-{evidence_text}
-
-Classify this connection into exactly ONE of these levels:
+CLASSIFICATION_RULES = """Classify each connection into exactly ONE of these levels:
 
 DIRECT - Named as participant in illegal activities: victim testimony naming them, evidence of sexual abuse, evidence of participation in trafficking. This is the highest level and requires the strongest evidence.
 
@@ -35,10 +29,79 @@ RULES:
 - Being in Epstein's contact book alone = CONTACT
 - Receiving donations from Epstein = FINANCIAL
 - If evidence spans multiple levels, classify at the HIGHEST supported level
-- When in doubt, classify LOWER (Contact rather than Direct)
+- When in doubt, classify LOWER (Contact rather than Direct)"""
+
+
+# Static blocks go in the system prompt with cache_control so Anthropic's
+# prompt caching reuses them server-side; only the case data varies per call.
+CLASSIFICATION_SYSTEM = """You are classifying the nature of a connection between a political figure and the Epstein network based ONLY on documentary evidence. The user message contains the person, their office, and the evidence.
+
+""" + CLASSIFICATION_RULES + """
 
 Respond with a JSON object:
-{{"level": "DIRECT|CONTACT|FINANCIAL|INSTITUTIONAL", "reasoning": "One sentence explaining why this level"}}"""
+{"level": "DIRECT|CONTACT|FINANCIAL|INSTITUTIONAL", "reasoning": "One sentence explaining why this level"}"""
+
+
+BATCH_CLASSIFICATION_SYSTEM = """You are classifying the nature of connections between political figures and the Epstein network based ONLY on documentary evidence. The user message contains multiple numbered cases. Classify each case independently.
+
+""" + CLASSIFICATION_RULES + """
+
+Respond with a JSON array containing one object per case, in the same order:
+[{"person": "name", "level": "DIRECT|CONTACT|FINANCIAL|INSTITUTIONAL", "reasoning": "One sentence explaining why this level"}]"""
+
+
+# Cases batched into a single prompt. Shares the rules preamble across cases
+# and cuts API round-trips roughly 10-fold.
+BATCH_SIZE = 10
+
+
+# Keywords whose meaning is fixed by the classification rules themselves:
+# donation-type evidence is FINANCIAL by definition, oversight-role evidence
+# is INSTITUTIONAL by definition. No judgment call involved.
+_FINANCIAL_KEYWORDS = ("donation", "campaign contribution", "campaign finance")
+_INSTITUTIONAL_KEYWORDS = ("prosecutor", "attorney general", "judge", "oversight committee")
+
+
+def _rule_classify(evidence: List[Dict]) -> Optional[str]:
+    """
+    Deterministically classify evidence sets that can't need AI judgment.
+
+    Only fires when EVERY evidence item maps to the same rule-defined level
+    (all financial or all institutional). Any item that could support a
+    higher level returns None so the AI sees the full picture - consistent
+    with the classify-at-the-highest-supported-level rule.
+    """
+    levels = set()
+    for ev in evidence:
+        desc = ev.get("description", "").lower()
+        etype = ev.get("evidence_type", "").lower()
+
+        if etype == "financial_transaction" or any(kw in desc for kw in _FINANCIAL_KEYWORDS):
+            levels.add("Financial")
+        elif any(kw in desc for kw in _INSTITUTIONAL_KEYWORDS):
+            levels.add("Institutional")
+        else:
+            return None  # Ambiguous evidence - needs AI judgment
+
+    if len(levels) == 1:
+        return levels.pop()
+    return None  # Mixed levels - let the AI weigh them
+
+
+def _build_evidence_text(evidence: List[Dict]) -> str:
+    """Format corroborated evidence into a numbered block for the prompt."""
+    evidence_parts = []
+    for i, ev in enumerate(evidence[:15], 1):  # Cap at 15 for token efficiency
+        source = ev.get("source_db", "unknown")
+        desc = ev.get("description", "")
+        raw = ev.get("raw_text", "")  # Already truncated at ingest
+        doc_id = ev.get("document_id", "unknown")
+
+        text = desc or raw
+        if text:
+            evidence_parts.append(f"{i}. [{source}] (Doc: {doc_id}) {text}")
+
+    return "\n".join(evidence_parts)
 
 
 def classify_connection(
@@ -61,51 +124,145 @@ def classify_connection(
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY not set.")
 
-    import anthropic
-
     # Build evidence text from all corroborating sources
-    evidence_parts = []
-    for i, ev in enumerate(evidence[:15], 1):  # Cap at 15 for token efficiency
-        source = ev.get("source_db", "unknown")
-        desc = ev.get("description", "")
-        raw = ev.get("raw_text", "")[:400]
-        doc_id = ev.get("document_id", "unknown")
-
-        text = desc or raw
-        if text:
-            evidence_parts.append(f"{i}. [{source}] (Doc: {doc_id}) {text}")
-
-    if not evidence_parts:
+    evidence_text = _build_evidence_text(evidence)
+    if not evidence_text:
         return {"level": "Contact", "reasoning": "No detailed evidence available; defaulting to lowest level."}
 
-    evidence_text = "\n".join(evidence_parts)
+    # Deterministic cases don't need (or pay for) an AI call
+    rule_level = _rule_classify(evidence)
+    if rule_level:
+        return {
+            "level": rule_level,
+            "reasoning": f"All corroborated evidence is {rule_level.lower()} by definition.",
+        }
 
-    prompt = CLASSIFICATION_PROMPT.format(
-        person_name=person_name,
-        office=office,
-        evidence_text=evidence_text,
+    case_text = (
+        f"PERSON: {person_name}\n"
+        f"OFFICE: {office}\n\n"
+        f"DOCUMENTARY EVIDENCE:\n{evidence_text}"
     )
 
-    client = anthropic.Anthropic(api_key=api_key)
-    response = client.messages.create(
+    response = get_client(api_key).messages.create(
         model="claude-haiku-4-5-20251001",
         max_tokens=200,
-        messages=[{"role": "user", "content": prompt}],
+        system=cached_system_block(CLASSIFICATION_SYSTEM),
+        messages=[{"role": "user", "content": case_text}],
     )
 
     answer = response.content[0].text.strip()
 
     # Parse JSON response
     try:
-        result = json.loads(answer)
-        level = result.get("level", "Contact")
+        result = orjson.loads(answer)
+        # The model answers in uppercase ("DIRECT"); normalize to the
+        # title-case levels the rest of the pipeline uses
+        level = result.get("level", "Contact").title()
         reasoning = result.get("reasoning", "")
 
         # Validate level is one we recognize
-        if level not in CONNECTION_LEVELS:
+        if level not in CONNECTION_LEVELS_SET:
             level = "Contact"  # Default to safest level
 
         return {"level": level, "reasoning": reasoning}
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         # If AI didn't return valid JSON, default to Contact (safest)
         return {"level": "Contact", "reasoning": f"Classification unclear; defaulting to Contact. Raw: {answer[:100]}"}
+
+
+def classify_connections_batch(
+    cases: List[Dict],
+    api_key: str = ANTHROPIC_API_KEY,
+    batch_size: int = BATCH_SIZE,
+) -> List[Dict]:
+    """
+    Classify multiple verified connections, batching several per API call.
+
+    Each classification is latency-bound on the round-trip to the API, and
+    the rules preamble dominates the prompt; batching shares both across up
+    to `batch_size` cases.
+
+    Args:
+        cases: List of dicts with 'person_name', 'office', 'evidence' keys
+        api_key: Anthropic API key
+        batch_size: Max cases per API call
+
+    Returns:
+        List of {"level": str, "reasoning": str}, parallel to cases.
+        Positional results keep same-named candidates in different races
+        from overwriting each other.
+    """
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not set.")
+
+    results: List[Optional[Dict]] = [None] * len(cases)
+
+    # Cases without evidence, or with rule-determined evidence, never need
+    # an API call
+    pending = []
+    for idx, case in enumerate(cases):
+        evidence = case.get("evidence", [])
+        evidence_text = _build_evidence_text(evidence)
+        if not evidence_text:
+            results[idx] = {
+                "level": "Contact",
+                "reasoning": "No detailed evidence available; defaulting to lowest level.",
+            }
+            continue
+
+        rule_level = _rule_classify(evidence)
+        if rule_level:
+            results[idx] = {
+                "level": rule_level,
+                "reasoning": f"All corroborated evidence is {rule_level.lower()} by definition.",
+            }
+            continue
+
+        pending.append((idx, case, evidence_text))
+
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+
+        case_blocks = []
+        for i, (_, case, evidence_text) in enumerate(batch, 1):
+            case_blocks.append(
+                f"CASE {i}\n"
+                f"PERSON: {case.get('person_name', 'Unknown')}\n"
+                f"OFFICE: {case.get('office', 'Unknown')}\n"
+                f"DOCUMENTARY EVIDENCE:\n{evidence_text}"
+            )
+
+        response = get_client(api_key).messages.create(
+            model="claude-haiku-4-5-20251001",
+            max_tokens=200 * len(batch),
+            system=cached_system_block(BATCH_CLASSIFICATION_SYSTEM),
+            messages=[{"role": "user", "content": "\n\n".join(case_blocks)}],
+        )
+
+        answer = response.content[0].text.strip()
+
+        try:
+            parsed = orjson.loads(answer)
+        except orjson.JSONDecodeError:
+            parsed = None
+
+        if isinstance(parsed, list) and len(parsed) == len(batch):
+            for (idx, _, _), item in zip(batch, parsed):
+                level = item.get("level", "Contact").title()
+                if level not in CONNECTION_LEVELS_SET:
+                    level = "Contact"  # Default to safest level
+                results[idx] = {
+                    "level": level,
+                    "reasoning": item.get("reasoning", ""),
+                }
+        else:
+            # Malformed batch response: fall back to one call per case
+            for idx, case, _ in batch:
+                results[idx] = classify_connection(
+                    case.get("person_name", "Unknown"),
+                    case.get("office", "Unknown"),
+                    case.get("evidence", []),
+                    api_key=api_key,
+                )
+
+    return results
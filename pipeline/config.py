@@ -23,12 +23,13 @@ PERPLEXITY_API_KEY = os.environ.get("PERPLEXITY_API_KEY", "")
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 
 # Cross-referencing thresholds
-FUZZY_MATCH_THRESHOLD = 92  # Minimum fuzzywuzzy score to consider a name match
+FUZZY_MATCH_THRESHOLD = 92  # Minimum fuzzy match score to consider a name match
 MIN_SOURCES_TO_DISPLAY = 2  # Minimum independent sources required to show a connection
 HIGH_CONFIDENCE_SOURCES = 3  # Sources needed for HIGH confidence rating
 
 # Connection levels (ordered by severity)
 CONNECTION_LEVELS = ["Direct", "Contact", "Financial", "Institutional"]
+CONNECTION_LEVELS_SET = frozenset(CONNECTION_LEVELS)  # O(1) validation lookups
 
 # Source database URLs
 SOURCES = {
@@ -0,0 +1,58 @@
+"""
+Persistent cache for Phase B disambiguation verdicts.
+
+The same (candidate, entity) pairs recur across pipeline runs - incumbents
+show up in every dataset - and a verdict never changes unless the prompt or
+model does. Verdicts are keyed by a hash of the exact request params, so a
+model upgrade or prompt edit invalidates old entries automatically.
+"""
+import hashlib
+import json
+import sqlite3
+import time
+from typing import Dict, Optional
+
+from pipeline.config import CACHE_DIR
+
+DB_FILENAME = "disambiguation_cache.db"
+
+_conn: Optional[sqlite3.Connection] = None
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        path = CACHE_DIR / DB_FILENAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(str(path), check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts "
+            "(key TEXT PRIMARY KEY, answer TEXT, model TEXT, ts INTEGER)"
+        )
+        _conn.commit()
+    return _conn
+
+
+def verdict_key(params: Dict) -> str:
+    """Stable hash of the prompt-affecting request params (model included)."""
+    return hashlib.sha1(
+        json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def get_verdict(key: str) -> Optional[str]:
+    """Return the cached verdict for this key, or None on a miss."""
+    row = _get_conn().execute(
+        "SELECT answer FROM verdicts WHERE key = ?", (key,)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def store_verdict(key: str, answer: str, model: str) -> None:
+    """Persist a verdict so future runs skip the API call."""
+    conn = _get_conn()
+    conn.execute(
+        "INSERT OR REPLACE INTO verdicts (key, answer, model, ts) VALUES (?, ?, ?, ?)",
+        (key, answer, model, int(time.time())),
+    )
+    conn.commit()
@@ -24,43 +24,34 @@ def corroborate_connection(
           - evidence_types: set of distinct evidence types across sources
           - caveat: optional string caveat for MEDIUM confidence
     """
-    sources = set(entity_data.get("sources", []))
-    num_sources = len(sources)
+    num_sources = len(set(entity_data.get("sources", [])))
 
-    # Count distinct evidence types across sources
-    evidence_types = set()
-    for conn in entity_data.get("connections", []):
-        etype = conn.get("evidence_type", conn.get("description", ""))
-        if etype:
-            evidence_types.add(etype.lower()[:50])  # Normalize and truncate
+    # Distinct evidence types across sources, normalized and truncated,
+    # collected in a single pass
+    evidence_types = {
+        etype.lower()[:50]
+        for conn in entity_data.get("connections", [])
+        if (etype := conn.get("evidence_type", conn.get("description", "")))
+    }
 
     # Apply thresholds
     if num_sources >= HIGH_CONFIDENCE_SOURCES:
-        return {
-            "display": True,
-            "confidence": "HIGH",
-            "num_sources": num_sources,
-            "evidence_types": evidence_types,
-            "caveat": None,
-        }
+        confidence, caveat = "HIGH", None
     elif num_sources >= MIN_SOURCES_TO_DISPLAY:
-        return {
-            "display": True,
-            "confidence": "MEDIUM",
-            "num_sources": num_sources,
-            "evidence_types": evidence_types,
-            "caveat": "Based on limited documentation from {n} independent sources.".format(
-                n=num_sources
-            ),
-        }
+        confidence = "MEDIUM"
+        caveat = "Based on limited documentation from {n} independent sources.".format(
+            n=num_sources
+        )
     else:
-        return {
-            "display": False,
-            "confidence": None,
-            "num_sources": num_sources,
-            "evidence_types": evidence_types,
-            "caveat": None,
-        }
+        confidence, caveat = None, None
+
+    return {
+        "display": confidence is not None,
+        "confidence": confidence,
+        "num_sources": num_sources,
+        "evidence_types": evidence_types,
+        "caveat": caveat,
+    }
 
 
 def filter_connections(
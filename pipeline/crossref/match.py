@@ -3,23 +3,84 @@ Two-phase candidate-to-entity matching:
   Phase A: Fuzzy string matching with high threshold
   Phase B: AI disambiguation to confirm identity
 """
+import asyncio
 import json
 import os
+import re
+import time
 from typing import Dict, List, Optional
 
-from thefuzz import fuzz
+from rapidfuzz import fuzz, process, utils
 
+from pipeline.candidates.merge import build_candidate_key
+from pipeline.anthropic_client import cached_system_block, get_async_client, get_client
 from pipeline.config import (
     ANTHROPIC_API_KEY,
     FUZZY_MATCH_THRESHOLD,
 )
+from pipeline.crossref.cache import get_verdict, store_verdict, verdict_key
 from pipeline.crossref.normalize import generate_name_variants, normalize_name
 
 
+# Minimum bigram Jaccard similarity for a target to reach the scoring
+# stage. Pairs scoring 92+ on token_sort_ratio share nearly all their
+# bigrams, so 0.35 prunes aggressively without losing real matches.
+BIGRAM_JACCARD_THRESHOLD = 0.35
+
+
+def _bigrams(s: str) -> frozenset:
+    """
+    Character bigrams of a string, as a frozenset.
+
+    Callers feed this utils.default_process output so the prefilter sees
+    exactly the strings the scorer compares.
+    """
+    return frozenset(s[i:i + 2] for i in range(len(s) - 1))
+
+
+def build_entity_index(entity_db: Dict[str, Dict]) -> tuple:
+    """
+    Precompute the normalized fuzzy-match targets for an entity database.
+
+    Normalizing every entity name and alias is the fixed cost of Phase A.
+    Building the target list once per database (instead of once per
+    candidate) turns a candidates x entities normalization bill into a
+    single entities-sized one. Each target also gets its bigram set, used
+    as a cheap prefilter ahead of edit-distance scoring.
+
+    Returns:
+        (entity_items, targets, target_entity, target_bigrams): the db items
+        as a list, the flattened normalized name/alias strings, a parallel
+        list mapping each target back to its entity_items index, and each
+        target's character-bigram frozenset.
+    """
+    entity_items = list(entity_db.items())
+    targets = []
+    target_entity = []
+    target_bigrams = []
+    for idx, (entity_name, entity_data) in enumerate(entity_items):
+        entity_norm = normalize_name(entity_name)
+        if not entity_norm:
+            continue
+
+        targets.append(entity_norm)
+        target_entity.append(idx)
+        target_bigrams.append(_bigrams(utils.default_process(entity_norm)))
+        for alias in entity_data.get("aliases", []):
+            alias_norm = normalize_name(alias)
+            if alias_norm:
+                targets.append(alias_norm)
+                target_entity.append(idx)
+                target_bigrams.append(_bigrams(utils.default_process(alias_norm)))
+
+    return entity_items, targets, target_entity, target_bigrams
+
+
 def fuzzy_match_candidate(
     candidate: Dict,
     entity_db: Dict[str, Dict],
     threshold: int = FUZZY_MATCH_THRESHOLD,
+    index: Optional[tuple] = None,
 ) -> List[Dict]:
     """
     Phase A: Find potential entity matches for a candidate using fuzzy string matching.
@@ -27,78 +88,215 @@ def fuzzy_match_candidate(
     Args:
         candidate: Dict with at least 'name', 'state', 'office' keys
         entity_db: Unified entity database {normalized_name: {sources, connections, ...}}
-        threshold: Minimum fuzzywuzzy score (default 92)
+        threshold: Minimum fuzzy match score (default 92)
+        index: Optional precomputed build_entity_index() result; pass one when
+            matching many candidates against the same database
 
     Returns:
         List of potential matches: [{entity_name, score, entity_data}]
     """
     candidate_variants = generate_name_variants(candidate["name"])
-    matches = []
-    seen_entities = set()
+    if not candidate_variants or not entity_db:
+        return []
 
-    for entity_name, entity_data in entity_db.items():
-        if entity_name in seen_entities:
-            continue
+    entity_items, targets, target_entity, target_bigrams = (
+        index or build_entity_index(entity_db)
+    )
 
-        entity_norm = normalize_name(entity_name)
-        if not entity_norm:
-            continue
+    if not targets:
+        return []
 
-        best_score = 0
-        for variant in candidate_variants:
-            # Try token_sort_ratio (handles word order differences)
-            score = fuzz.token_sort_ratio(variant, entity_norm)
-            best_score = max(best_score, score)
-
-            # Also try against entity's own variants if available
-            entity_aliases = entity_data.get("aliases", [])
-            for alias in entity_aliases:
-                alias_norm = normalize_name(alias)
-                score = fuzz.token_sort_ratio(variant, alias_norm)
-                best_score = max(best_score, score)
-
-        if best_score >= threshold:
-            seen_entities.add(entity_name)
-            matches.append({
-                "entity_name": entity_name,
-                "score": best_score,
-                "entity_data": entity_data,
-            })
+    # Stage 1: bigram-overlap prefilter. Set intersection is far cheaper
+    # than edit distance, and most of the corpus shares almost no bigrams
+    # with any given candidate.
+    cand_bigrams = frozenset(
+        b for v in candidate_variants for b in _bigrams(utils.default_process(v))
+    )
+    keep = [
+        i
+        for i, bg in enumerate(target_bigrams)
+        if bg
+        and len(cand_bigrams & bg) / len(cand_bigrams | bg) >= BIGRAM_JACCARD_THRESHOLD
+    ]
+    if not keep:
+        return []
+
+    targets = [targets[i] for i in keep]
+    target_entity = [target_entity[i] for i in keep]
+
+    # Stage 2: one C++ call scores every variant against every surviving
+    # target; score_cutoff lets RapidFuzz prune hopeless pairs early
+    # default_process strips punctuation the way thefuzz's full_process
+    # did, so hyphenated and comma'd spellings still score as matches
+    scores = process.cdist(
+        candidate_variants,
+        targets,
+        scorer=fuzz.token_sort_ratio,
+        processor=utils.default_process,
+        score_cutoff=threshold,
+        workers=-1,
+    )
+    best_per_target = scores.max(axis=0)
+
+    # Collapse target scores back onto entities (an entity may have several
+    # targets via aliases)
+    best_scores = {}
+    for t_idx, score in enumerate(best_per_target):
+        if score >= threshold:
+            e_idx = target_entity[t_idx]
+            if score > best_scores.get(e_idx, 0):
+                best_scores[e_idx] = score
+
+    matches = [
+        {
+            "entity_name": entity_items[e_idx][0],
+            # Plain float, not the numpy scalar cdist hands back - match
+            # dicts get JSON-serialized downstream
+            "score": float(score),
+            "entity_data": entity_items[e_idx][1],
+        }
+        for e_idx, score in best_scores.items()
+    ]
 
     # Sort by score descending
     matches.sort(key=lambda x: x["score"], reverse=True)
     return matches
 
 
-def ai_disambiguate(
-    candidate: Dict,
-    entity_name: str,
-    entity_data: Dict,
-    api_key: str = ANTHROPIC_API_KEY,
-) -> str:
+def fuzzy_match_candidates(
+    candidates: List[Dict],
+    entity_db: Dict[str, Dict],
+    threshold: int = FUZZY_MATCH_THRESHOLD,
+    index: Optional[tuple] = None,
+) -> List[List[Dict]]:
     """
-    Phase B: Use Claude Haiku to determine if a candidate and entity are the same person.
+    Phase A over a whole candidate list with a single scoring call.
 
-    Args:
-        candidate: Dict with 'name', 'state', 'district', 'office', 'party', etc.
-        entity_name: Name as it appears in Epstein documents
-        entity_data: Dict with connections, source documents, categories
+    cdist already fans out across a C-level thread pool (workers=-1), so
+    instead of wrapping candidates in a process pool - which would copy the
+    entity index into every worker - all candidates' variants are stacked
+    into one score matrix and a single call saturates every core over the
+    whole batch.
 
     Returns:
-        "YES", "NO", or "UNCERTAIN"
+        List of match lists, parallel to candidates.
     """
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY not set. Cannot perform AI disambiguation.")
+    entity_items, targets, target_entity, target_bigrams = (
+        index or build_entity_index(entity_db)
+    )
+    results: List[List[Dict]] = [[] for _ in candidates]
+    if not targets:
+        return results
+
+    # Stack each candidate's variants, remembering its row span and which
+    # targets survived its bigram prefilter
+    all_variants = []
+    spans = []
+    union_cols: Dict[int, int] = {}
+    for candidate in candidates:
+        variants = generate_name_variants(candidate["name"])
+        if not variants:
+            spans.append(None)
+            continue
 
-    import anthropic
+        cand_bigrams = frozenset(
+            b for v in variants for b in _bigrams(utils.default_process(v))
+        )
+        keep = [
+            i
+            for i, bg in enumerate(target_bigrams)
+            if bg
+            and len(cand_bigrams & bg) / len(cand_bigrams | bg)
+            >= BIGRAM_JACCARD_THRESHOLD
+        ]
+        if not keep:
+            spans.append(None)
+            continue
+
+        start = len(all_variants)
+        all_variants.extend(variants)
+        spans.append((start, len(all_variants), keep))
+        for t_idx in keep:
+            union_cols.setdefault(t_idx, len(union_cols))
+
+    if not all_variants:
+        return results
+
+    union_targets = [""] * len(union_cols)
+    for t_idx, col in union_cols.items():
+        union_targets[col] = targets[t_idx]
+
+    scores = process.cdist(
+        all_variants,
+        union_targets,
+        scorer=fuzz.token_sort_ratio,
+        processor=utils.default_process,
+        score_cutoff=threshold,
+        workers=-1,
+    )
+
+    for ci, span in enumerate(spans):
+        if span is None:
+            continue
+        start, end, keep = span
+        block = scores[start:end]
+
+        best_scores = {}
+        for t_idx in keep:
+            score = block[:, union_cols[t_idx]].max()
+            if score >= threshold:
+                e_idx = target_entity[t_idx]
+                if score > best_scores.get(e_idx, 0):
+                    best_scores[e_idx] = score
+
+        matches = [
+            {
+                "entity_name": entity_items[e_idx][0],
+                "score": float(score),
+                "entity_data": entity_items[e_idx][1],
+            }
+            for e_idx, score in best_scores.items()
+        ]
+        matches.sort(key=lambda x: x["score"], reverse=True)
+        results[ci] = matches
+
+    return results
+
+
+# Concurrent disambiguation calls in flight at once. Sized for a Tier 1
+# account (50 RPM); raise on higher tiers.
+MAX_CONCURRENT_DISAMBIGUATIONS = 20
+
+# Retries on rate-limit responses, with exponential backoff starting here
+_RETRY_BASE_DELAY = 1.0
+_MAX_RETRIES = 5
 
-    client = anthropic.Anthropic(api_key=api_key)
 
+# Static instructions go in the system prompt with cache_control so
+# Anthropic's prompt caching reuses them server-side; only the
+# CANDIDATE/PERSON blocks vary per call.
+DISAMBIGUATION_SYSTEM = """You are verifying whether a political candidate and a person named in Epstein-related documents are the same individual. The user message contains the candidate's details and the person as they appear in the documents.
+
+QUESTION: Based on the information provided, is the candidate the SAME PERSON as the individual named in the Epstein documents?
+
+Consider:
+- Do the names match (accounting for nicknames, middle names, suffixes)?
+- Does the geographic/professional context match (state, career, time period)?
+- Could this be a different person who happens to share the same name?
+
+Respond with exactly one word: YES, NO, or UNCERTAIN.
+- YES: You are confident they are the same person.
+- NO: You are confident they are different people (name collision, wrong state/era, etc.)
+- UNCERTAIN: Not enough information to determine. (Treated as NO for safety.)"""
+
+
+def _build_disambiguation_prompt(candidate: Dict, entity_name: str, entity_data: Dict) -> str:
+    """Build the per-pair user message: just the CANDIDATE and PERSON blocks."""
     # Build context about the entity from documents
     entity_context_parts = []
     for conn in entity_data.get("connections", [])[:10]:  # Limit to 10 for token efficiency
         desc = conn.get("description", "")
-        raw = conn.get("raw_text", "")[:500]  # Truncate long text
+        raw = conn.get("raw_text", "")  # Already truncated at ingest
         source = conn.get("source_db", "unknown")
         if desc:
             entity_context_parts.append(f"[{source}] {desc}")
@@ -108,9 +306,7 @@ def ai_disambiguate(
     entity_context = "\n".join(entity_context_parts) if entity_context_parts else "No detailed context available."
     categories = ", ".join(entity_data.get("categories", ["unknown"]))
 
-    prompt = f"""You are verifying whether a political candidate and a person named in Epstein-related documents are the same individual.
-
-CANDIDATE:
+    return f"""CANDIDATE:
 - Name: {candidate.get('name', 'Unknown')}
 - Office: {candidate.get('office', 'Unknown')}
 - State: {candidate.get('state', 'Unknown')}
@@ -123,29 +319,62 @@ PERSON IN EPSTEIN DOCUMENTS:
 - Name as it appears: {entity_name}
 - Categories: {categories}
 - Document context:
-{entity_context}
+{entity_context}"""
 
-QUESTION: Based on the information above, is the candidate the SAME PERSON as the individual named in the Epstein documents?
 
-Consider:
-- Do the names match (accounting for nicknames, middle names, suffixes)?
-- Does the geographic/professional context match (state, career, time period)?
-- Could this be a different person who happens to share the same name?
+# Cheap-router threshold: short, clear contexts go to Haiku; long ambiguous
+# dossiers get the stronger (pricier) model
+_HAIKU_MODEL = "claude-haiku-4-5-20251001"
+_SONNET_MODEL = "claude-sonnet-4-5-20250929"
+_SONNET_CONTEXT_THRESHOLD = 2000
 
-Respond with exactly one word: YES, NO, or UNCERTAIN.
-- YES: You are confident they are the same person.
-- NO: You are confident they are different people (name collision, wrong state/era, etc.)
-- UNCERTAIN: Not enough information to determine. (Treated as NO for safety.)"""
 
-    response = client.messages.create(
-        model="claude-haiku-4-5-20251001",
-        max_tokens=10,
-        messages=[{"role": "user", "content": prompt}],
-    )
+def _build_disambiguation_params(candidate: Dict, entity_name: str, entity_data: Dict) -> Dict:
+    """Full messages.create params for one pair; shared by all Phase B paths."""
+    prompt = _build_disambiguation_prompt(candidate, entity_name, entity_data)
+    model = _HAIKU_MODEL if len(prompt) <= _SONNET_CONTEXT_THRESHOLD else _SONNET_MODEL
+    # The answer is a single word, so the newline stop sequence lets the
+    # server truncate instead of generating toward the token cap
+    return {
+        "model": model,
+        "max_tokens": 5,
+        "stop_sequences": ["\n"],
+        "system": cached_system_block(DISAMBIGUATION_SYSTEM),
+        "messages": [{"role": "user", "content": prompt}],
+    }
+
+
+def _gate_verdict(candidate: Dict, entity_name: str, entity_data: Dict) -> Optional[str]:
+    """
+    Resolve clear-cut pairs without an API call.
+
+    An entity with no documented connections gives the model nothing to
+    corroborate against, so UNCERTAIN (treated as NO downstream) is the only
+    honest answer. An exact normalized-name match whose document context
+    also mentions the candidate's state is a confident YES. Everything else
+    returns None and goes to the model.
+    """
+    connections = entity_data.get("connections", [])
+    if not connections:
+        return "UNCERTAIN"
 
-    answer = response.content[0].text.strip().upper()
+    if normalize_name(candidate.get("name", "")) == normalize_name(entity_name):
+        state = candidate.get("state", "")
+        if state:
+            # Word-bounded so "NY" doesn't match inside "many"
+            state_re = re.compile(rf"\b{re.escape(state)}\b", re.IGNORECASE)
+            for conn in connections[:10]:
+                if state_re.search(conn.get("description", "")) or state_re.search(
+                    conn.get("raw_text", "")
+                ):
+                    return "YES"
 
-    # Only accept exact YES
+    return None
+
+
+def _parse_verdict(answer: str) -> str:
+    """Collapse a model reply to YES/NO/UNCERTAIN; only exact YES is accepted."""
+    answer = answer.strip().upper()
     if answer == "YES":
         return "YES"
     elif answer == "NO":
@@ -154,10 +383,186 @@ Respond with exactly one word: YES, NO, or UNCERTAIN.
         return "UNCERTAIN"
 
 
+def ai_disambiguate(
+    candidate: Dict,
+    entity_name: str,
+    entity_data: Dict,
+    api_key: str = ANTHROPIC_API_KEY,
+) -> str:
+    """
+    Phase B: Use Claude Haiku to determine if a candidate and entity are the same person.
+
+    Args:
+        candidate: Dict with 'name', 'state', 'district', 'office', 'party', etc.
+        entity_name: Name as it appears in Epstein documents
+        entity_data: Dict with connections, source documents, categories
+
+    Returns:
+        "YES", "NO", or "UNCERTAIN"
+    """
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not set. Cannot perform AI disambiguation.")
+
+    gated = _gate_verdict(candidate, entity_name, entity_data)
+    if gated is not None:
+        return gated
+
+    params = _build_disambiguation_params(candidate, entity_name, entity_data)
+    key = verdict_key(params)
+    cached = get_verdict(key)
+    if cached is not None:
+        return cached
+
+    # Stream and disconnect as soon as a complete verdict word has arrived,
+    # rather than waiting for full response assembly
+    buf = ""
+    with get_client(api_key).messages.stream(**params) as stream:
+        for text in stream.text_stream:
+            buf += text
+            if buf.strip().upper().startswith(("YES", "NO", "UNCERTAIN")):
+                break
+
+    verdict = _parse_verdict(buf)
+    store_verdict(key, verdict, params["model"])
+    return verdict
+
+
+async def ai_disambiguate_async(
+    candidate: Dict,
+    entity_name: str,
+    entity_data: Dict,
+    api_key: str = ANTHROPIC_API_KEY,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> str:
+    """
+    Async variant of ai_disambiguate, for fanning out many pairs at once.
+
+    Retries with exponential backoff on rate-limit responses; pass a shared
+    semaphore to cap how many calls are in flight across a batch.
+
+    Returns:
+        "YES", "NO", or "UNCERTAIN"
+    """
+    import anthropic
+
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not set. Cannot perform AI disambiguation.")
+
+    gated = _gate_verdict(candidate, entity_name, entity_data)
+    if gated is not None:
+        return gated
+
+    client = get_async_client(api_key)
+    params = _build_disambiguation_params(candidate, entity_name, entity_data)
+    key = verdict_key(params)
+    cached = get_verdict(key)
+    if cached is not None:
+        return cached
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DISAMBIGUATIONS)
+
+    delay = _RETRY_BASE_DELAY
+    async with semaphore:
+        for attempt in range(_MAX_RETRIES):
+            try:
+                response = await client.messages.create(**params)
+                verdict = _parse_verdict(response.content[0].text)
+                store_verdict(key, verdict, params["model"])
+                return verdict
+            except anthropic.RateLimitError:
+                if attempt == _MAX_RETRIES - 1:
+                    raise
+                await asyncio.sleep(delay)
+                delay *= 2
+
+
+async def _disambiguate_pairs(pairs: List[tuple], api_key: str = ANTHROPIC_API_KEY) -> List[str]:
+    """Run ai_disambiguate_async over (candidate, entity_name, entity_data) pairs."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DISAMBIGUATIONS)
+    tasks = [
+        ai_disambiguate_async(candidate, entity_name, entity_data, api_key, semaphore)
+        for candidate, entity_name, entity_data in pairs
+    ]
+    return await asyncio.gather(*tasks)
+
+
+# How often to poll an in-flight message batch for completion
+BATCH_POLL_INTERVAL = 30.0
+
+
+def disambiguate_pairs_batch(
+    pairs: List[tuple],
+    api_key: str = ANTHROPIC_API_KEY,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+) -> List[str]:
+    """
+    Disambiguate pairs through the Anthropic Message Batches API.
+
+    Batch jobs run outside the synchronous rate-limit pool at a 50% token
+    discount, at the cost of minutes-scale turnaround - the right trade for
+    offline cross-reference runs. Blocks until the batch completes.
+
+    Args:
+        pairs: List of (candidate, entity_name, entity_data) tuples
+        api_key: Anthropic API key
+        poll_interval: Seconds between completion polls
+
+    Returns:
+        List of "YES"/"NO"/"UNCERTAIN" verdicts, parallel to pairs. Pairs
+        whose request errored come back UNCERTAIN (treated as NO downstream).
+    """
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not set. Cannot perform AI disambiguation.")
+    if not pairs:
+        return []
+
+    verdicts = ["UNCERTAIN"] * len(pairs)
+
+    # Only pairs that clear the gate and miss the cache go into the batch
+    requests = []
+    keys = {}
+    for i, (candidate, entity_name, entity_data) in enumerate(pairs):
+        gated = _gate_verdict(candidate, entity_name, entity_data)
+        if gated is not None:
+            verdicts[i] = gated
+            continue
+
+        params = _build_disambiguation_params(candidate, entity_name, entity_data)
+        key = verdict_key(params)
+        cached = get_verdict(key)
+        if cached is not None:
+            verdicts[i] = cached
+        else:
+            requests.append({"custom_id": f"pair-{i}", "params": params})
+            keys[i] = (key, params["model"])
+
+    if not requests:
+        return verdicts
+
+    client = get_client(api_key)
+    batch = client.messages.batches.create(requests=requests)
+
+    while batch.processing_status != "ended":
+        time.sleep(poll_interval)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    for result in client.messages.batches.results(batch.id):
+        idx = int(result.custom_id.rsplit("-", 1)[1])
+        if result.result.type == "succeeded":
+            verdict = _parse_verdict(result.result.message.content[0].text)
+            verdicts[idx] = verdict
+            key, model = keys[idx]
+            store_verdict(key, verdict, model)
+
+    return verdicts
+
+
 def match_candidates_to_entities(
     candidates: List[Dict],
     entity_db: Dict[str, Dict],
     use_ai: bool = True,
+    use_batch_api: bool = False,
 ) -> Dict[str, List[Dict]]:
     """
     Run the full two-phase matching pipeline.
@@ -166,34 +571,48 @@ def match_candidates_to_entities(
         candidates: List of candidate dicts
         entity_db: Unified entity database
         use_ai: Whether to run Phase B (AI disambiguation). Set False for testing.
+        use_batch_api: Route Phase B through the Message Batches API instead
+            of concurrent synchronous calls - half the token cost, but the
+            run blocks until the batch finishes. Use for large offline runs.
 
     Returns:
         Dict mapping candidate name -> list of confirmed entity matches
     """
     results = {}
 
-    for candidate in candidates:
-        candidate_key = f"{candidate['name']}|{candidate.get('state', '')}|{candidate.get('office', '')}"
+    # Normalize the entity database once for the whole candidate list
+    entity_index = build_entity_index(entity_db)
 
-        # Phase A: Fuzzy matching
-        fuzzy_matches = fuzzy_match_candidate(candidate, entity_db)
+    # Phase A: one scoring call across every candidate
+    all_matches = fuzzy_match_candidates(candidates, entity_db, index=entity_index)
 
-        if not fuzzy_matches:
-            results[candidate_key] = []
-            continue
+    # Each Phase B call is a blocking network round-trip, so pairs are
+    # collected across all candidates and disambiguated concurrently
+    pairs = []
+    pair_targets = []  # (candidate_key, match) parallel to pairs
+
+    for candidate, fuzzy_matches in zip(candidates, all_matches):
+        candidate_key = build_candidate_key(candidate)
+        results[candidate_key] = []
 
-        confirmed = []
         for match in fuzzy_matches:
             if use_ai:
-                # Phase B: AI disambiguation
-                verdict = ai_disambiguate(candidate, match["entity_name"], match["entity_data"])
-                if verdict == "YES":
-                    confirmed.append(match)
+                pairs.append((candidate, match["entity_name"], match["entity_data"]))
+                pair_targets.append((candidate_key, match))
             else:
                 # Without AI, only accept very high fuzzy scores (98+)
                 if match["score"] >= 98:
-                    confirmed.append(match)
-
-        results[candidate_key] = confirmed
+                    results[candidate_key].append(match)
+
+    if pairs:
+        # Phase B: AI disambiguation, either via a discounted offline batch
+        # or fanned out under a shared semaphore
+        if use_batch_api:
+            verdicts = disambiguate_pairs_batch(pairs)
+        else:
+            verdicts = asyncio.run(_disambiguate_pairs(pairs))
+        for (candidate_key, match), verdict in zip(pair_targets, verdicts):
+            if verdict == "YES":
+                results[candidate_key].append(match)
 
     return results
@@ -2,7 +2,9 @@
 Name normalization for cross-referencing Epstein entities with political candidates.
 Handles titles, nicknames, suffixes, and common variations.
 """
+import functools
 import re
+import sys
 from typing import List
 
 # Common political/professional titles to strip
@@ -60,7 +62,6 @@ NICKNAMES = {
     "betsy": "elizabeth",
     "liz": "elizabeth",
     "lizzy": "elizabeth",
-    "beth": "elizabeth",
     "betty": "elizabeth",
     "cathy": "catherine",
     "kate": "catherine",
@@ -116,51 +117,96 @@ NICKNAMES = {
     "wes": "wesley",
 }
 
+# Formal name -> known nicknames, inverted from NICKNAMES once at import
+# instead of on every variant-generation call
+_REVERSE_NICKNAMES = {}
+for _nick, _formal in NICKNAMES.items():
+    _REVERSE_NICKNAMES.setdefault(_formal, []).append(_nick)
+_REVERSE_NICKNAMES = {k: tuple(v) for k, v in _REVERSE_NICKNAMES.items()}
+
 # Suffixes to strip for matching but preserve for display
 SUFFIXES = ["jr.", "jr", "junior", "sr.", "sr", "senior", "ii", "iii", "iv", "v",
             "2nd", "3rd", "4th", "esq.", "esq", "m.d.", "md", "ph.d.", "phd"]
 
+# Precompiled patterns: one alternation per category, built once at import,
+# so each name is scanned a constant number of times instead of once per
+# title/suffix entry. Longest-first ordering keeps multi-word entries like
+# "vice president" from losing to their substrings.
+_PAREN_RE = re.compile(r'\([^)]*\)')
 
-def normalize_name(name: str) -> str:
+# Periods become spaces via one C-level translate; whitespace collapse is
+# ' '.join(s.split()), the fastest collapse available in CPython.
+_PERIOD_TABLE = str.maketrans('.', ' ')
+
+_TITLE_WORDS = sorted({t.replace('.', '').strip() for t in TITLES}, key=len, reverse=True)
+_TITLE_RE = re.compile(r'\b(?:' + '|'.join(re.escape(t) for t in _TITLE_WORDS) + r')\b')
+
+# Suffixes are all single tokens once periods are gone, so stripping them
+# is a pop-while-member loop over the token tail - no regex engine needed.
+# Titles keep the alternation: multi-word entries like "vice president"
+# only match as phrases.
+_SUFFIX_SET = frozenset(s.replace('.', '').strip() for s in SUFFIXES)
+
+
+@functools.lru_cache(maxsize=131072)
+def _normalize_parts(name: str) -> tuple:
     """
-    Normalize a name for comparison. Returns lowercase, stripped of titles/suffixes,
-    with nicknames expanded to formal names.
+    The shared tokenizing core of normalization: lowercase, strip titles,
+    suffixes and parentheticals, expand the first-name nickname, and return
+    the resulting tokens. normalize_name joins them; variant generation
+    consumes the tuple directly instead of re-splitting the joined string.
     """
     if not name:
-        return ""
+        return ()
 
     result = name.lower().strip()
 
     # Remove parenthetical content like "(D-CA)" or "(Republican)"
-    result = re.sub(r'\([^)]*\)', '', result).strip()
+    result = _PAREN_RE.sub('', result).strip()
 
     # Remove all periods first (Sen. -> Sen, J.F. -> JF, Jr. -> Jr)
-    result = result.replace('.', ' ')
-    result = re.sub(r'\s+', ' ', result).strip()
+    result = ' '.join(result.translate(_PERIOD_TABLE).split())
 
     # Remove titles (now without periods: "sen", "rep", "hon", "dr", etc.)
-    for title in TITLES:
-        title_clean = title.replace('.', '').strip()
-        # Match as whole word
-        result = re.sub(r'\b' + re.escape(title_clean) + r'\b', '', result)
+    result = _TITLE_RE.sub('', result)
 
-    # Remove suffixes
-    for suffix in SUFFIXES:
-        suffix_clean = suffix.replace('.', '').strip()
-        result = re.sub(r',?\s*\b' + re.escape(suffix_clean) + r'\b$', '', result)
+    parts = result.split()
 
-    # Clean up whitespace
-    result = re.sub(r'\s+', ' ', result).strip()
+    # Pop stacked suffixes off the tail ("smith, jr., iii" -> "smith").
+    # Commas ride along with (or between) the tokens, so strip them when
+    # checking, pop bare-comma tokens, and drop a trailing comma left on
+    # the new last token after a pop
+    popped = False
+    while parts:
+        last = parts[-1].rstrip(',')
+        if last in _SUFFIX_SET or not last:
+            parts.pop()
+            popped = True
+        else:
+            break
+    if popped and parts:
+        parts[-1] = parts[-1].rstrip(',')
 
-    # Expand first-name nicknames
-    parts = result.split()
+    # Expand first-name nicknames (one dict probe; deliberately only the
+    # first token - "bill" as a surname is not a nickname)
     if parts:
-        first = parts[0]
-        if first in NICKNAMES:
-            parts[0] = NICKNAMES[first]
-        result = ' '.join(parts)
+        formal = NICKNAMES.get(parts[0])
+        if formal is not None:
+            parts[0] = formal
 
-    return result.strip()
+    return tuple(parts)
+
+
+@functools.lru_cache(maxsize=131072)
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for comparison. Returns lowercase, stripped of titles/suffixes,
+    with nicknames expanded to formal names.
+
+    Results are memoized: the same raw names recur constantly (incumbents
+    appear in both ProPublica and FEC; entities recur across merge passes).
+    """
+    return ' '.join(_normalize_parts(name))
 
 
 def generate_name_variants(name: str) -> List[str]:
@@ -168,54 +214,72 @@ def generate_name_variants(name: str) -> List[str]:
     Generate multiple plausible variants of a name for fuzzy matching.
     Returns a list of normalized name variants.
     """
-    variants = set()
+    # Variant generation is pure and hit with the same names over and over
+    # (per candidate in fuzzy matching, again in names_match), so the work
+    # is memoized on an internal tuple-returning helper.
+    return list(_generate_name_variants_cached(name))
 
-    normalized = normalize_name(name)
-    if normalized:
-        variants.add(normalized)
 
-    parts = normalized.split()
+@functools.lru_cache(maxsize=65536)
+def _generate_name_variants_cached(name: str) -> tuple:
+    parts = _normalize_parts(name)
     if not parts:
-        return list(variants)
+        return ()
+
+    normalized = normalize_name(name)
+    variants = [normalized]
 
-    # Full name as-is
-    variants.add(normalized)
+    # Single-word names have no middle-name or nickname permutations
+    if len(parts) == 1:
+        return tuple(variants)
 
     # If there are 3+ parts, try first + last (skipping middle)
     if len(parts) >= 3:
-        variants.add(f"{parts[0]} {parts[-1]}")
+        variants.append(f"{parts[0]} {parts[-1]}")
 
-    # If first name has a nickname mapping, try both directions
     first = parts[0]
-    rest = ' '.join(parts[1:]) if len(parts) > 1 else ''
+    rest = ' '.join(parts[1:])
 
     # Try the original first name (before nickname expansion)
     original_lower = name.lower().strip().split()
-    if original_lower:
-        original_first = original_lower[0]
-        if original_first != first and rest:
-            variants.add(f"{original_first} {rest}")
+    if original_lower and original_lower[0] != first:
+        variants.append(f"{original_lower[0]} {rest}")
 
     # Try reverse nickname lookup (formal -> common nicknames)
-    reverse_nicknames = {}
-    for nick, formal in NICKNAMES.items():
-        if formal not in reverse_nicknames:
-            reverse_nicknames[formal] = []
-        reverse_nicknames[formal].append(nick)
+    for nick in _REVERSE_NICKNAMES.get(first, ()):
+        variants.append(f"{nick} {rest}")
 
-    if first in reverse_nicknames and rest:
-        for nick in reverse_nicknames[first]:
-            variants.add(f"{nick} {rest}")
-
-    return list(variants)
+    # Order-preserving dedup, cheaper than a set plus re-listing. Variants
+    # end up as dict keys all over the merge/match path; interning them
+    # (once, thanks to the cache) turns those key comparisons into pointer
+    # checks and collapses duplicate strings across entities.
+    return tuple(map(sys.intern, dict.fromkeys(variants)))
 
 
 def names_match(name_a: str, name_b: str) -> bool:
     """
     Check if two names likely refer to the same person after normalization.
-    Uses exact match on normalized forms. For fuzzy matching, use thefuzz library
-    in the match.py module.
+    Uses exact match on normalized forms. For fuzzy matching, use the RapidFuzz
+    scorers in the match.py module.
     """
+    if not name_a or not name_b:
+        return False
+
+    # Case-insensitively identical inputs dominate real comparisons; one
+    # normalization pass settles them (it still rules out title-only
+    # degenerates like "Dr." vs "Dr.", which normalize to nothing)
+    if name_a == name_b or name_a.lower() == name_b.lower():
+        return bool(normalize_name(name_a))
+
+    # The comparison is symmetric, so memoize on an unordered pair - (a, b)
+    # and (b, a) share one cache entry
+    return _names_match_cached(frozenset((name_a, name_b)))
+
+
+@functools.lru_cache(maxsize=200000)
+def _names_match_cached(pair: frozenset) -> bool:
+    name_a, name_b = pair
+
     norm_a = normalize_name(name_a)
     norm_b = normalize_name(name_b)
 
@@ -226,8 +290,8 @@ def names_match(name_a: str, name_b: str) -> bool:
     if norm_a == norm_b:
         return True
 
-    # Check all variants
-    variants_a = set(generate_name_variants(name_a))
-    variants_b = set(generate_name_variants(name_b))
+    # Check all variants (the cached tuples directly - no list copy)
+    variants_a = set(_generate_name_variants_cached(name_a))
+    variants_b = set(_generate_name_variants_cached(name_b))
 
     return bool(variants_a & variants_b)
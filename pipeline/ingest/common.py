@@ -2,15 +2,28 @@
 Common types and utilities for all ingestion modules.
 Every ingestion module outputs entities in this standard format.
 """
+import sys
+import time
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional
-import json
+from typing import Dict, Iterable, List, Optional
 from pathlib import Path
 
+import orjson
+
 from pipeline.config import CACHE_DIR
 
 
-@dataclass
+# Raw document text is only ever shown/sent truncated, so clip it once at
+# ingest instead of re-slicing multi-KB strings on every render.
+RAW_TEXT_MAX = 512
+
+
+# slots=True drops the per-instance __dict__ on both record types; with
+# hundreds of thousands of connections in a merged DB, that's the
+# difference between fitting in RAM comfortably or not. frozen=True is off
+# the table: merge_entity_databases extends connection/source lists in
+# place and __post_init__ clips raw_text after construction.
+@dataclass(slots=True)
 class EntityConnection:
     """A single piece of evidence connecting a person to the Epstein network."""
     description: str
@@ -19,8 +32,12 @@ class EntityConnection:
     raw_text: str = ""
     evidence_type: str = ""  # e.g., "flight_log", "email", "co-occurrence", "testimony"
 
+    def __post_init__(self):
+        if len(self.raw_text) > RAW_TEXT_MAX:
+            self.raw_text = self.raw_text[:RAW_TEXT_MAX]
 
-@dataclass
+
+@dataclass(slots=True)
 class Entity:
     """A person extracted from Epstein documents."""
     name: str
@@ -30,7 +47,22 @@ class Entity:
     aliases: List[str] = field(default_factory=list)
     total_document_mentions: int = 0
 
-    def to_dict(self) -> Dict:
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> Dict:
+        """
+        Materialize the entity as a plain dict.
+
+        fields restricts the output to the named attributes, so callers
+        that want a couple of scalars skip the per-connection asdict pass -
+        the expensive part for heavily connected entities. Bulk
+        serialization bypasses this entirely (save_entity_db hands the
+        dataclasses straight to orjson).
+        """
+        if fields is not None:
+            return {
+                f: [asdict(c) for c in self.connections] if f == "connections"
+                else getattr(self, f)
+                for f in fields
+            }
         return {
             "name": self.name,
             "sources": self.sources,
@@ -45,18 +77,33 @@ def merge_entity_databases(*databases: Dict[str, Entity]) -> Dict[str, Entity]:
     """
     Merge multiple entity databases into a unified one.
     Entities with matching normalized names are combined.
+
+    Matching is deliberately exact on the normalized form. Looser variant
+    keys (first+last, nickname reversals) would collapse distinct people -
+    "James Edward Smith" and "James Alan Smith" share the first+last
+    variant - combining their evidence and inflating source counts past
+    the display threshold. Suspected same-person spellings go through the
+    AI disambiguation path instead, where context is weighed.
     """
     from pipeline.crossref.normalize import normalize_name
 
     merged: Dict[str, Entity] = {}
 
+    # Side sets mirroring each record's aliases list, so alias dedup is an
+    # O(1) probe instead of a scan that grows with every merged spelling.
+    # The dataclass fields themselves stay lists: orjson serializes them
+    # directly and their insertion order is what the frontend displays.
+    alias_seen: Dict[str, set] = {}
+
     for db in databases:
         for name, entity in db.items():
-            norm = normalize_name(name)
+            # Interned keys make the dict probes below pointer comparisons
+            norm = sys.intern(normalize_name(name))
             if not norm:
                 continue
 
-            if norm not in merged:
+            existing = merged.get(norm)
+            if existing is None:
                 merged[norm] = Entity(
                     name=entity.name,
                     sources=list(entity.sources),
@@ -65,9 +112,10 @@ def merge_entity_databases(*databases: Dict[str, Entity]) -> Dict[str, Entity]:
                     aliases=list(entity.aliases),
                     total_document_mentions=entity.total_document_mentions,
                 )
+                alias_seen[norm] = set(entity.aliases)
             else:
-                existing = merged[norm]
-                # Add new sources
+                seen = alias_seen[norm]
+                # Add new sources (at most a handful, scan is fine)
                 for src in entity.sources:
                     if src not in existing.sources:
                         existing.sources.append(src)
@@ -78,22 +126,34 @@ def merge_entity_databases(*databases: Dict[str, Entity]) -> Dict[str, Entity]:
                     if cat not in existing.categories:
                         existing.categories.append(cat)
                 # Add aliases
-                if entity.name != existing.name and entity.name not in existing.aliases:
+                if entity.name != existing.name and entity.name not in seen:
                     existing.aliases.append(entity.name)
+                    seen.add(entity.name)
                 for alias in entity.aliases:
-                    if alias not in existing.aliases:
+                    if alias not in seen:
                         existing.aliases.append(alias)
+                        seen.add(alias)
                 # Sum mentions
                 existing.total_document_mentions += entity.total_document_mentions
 
     return merged
 
 
-def save_entity_db(entities: Dict[str, Entity], filename: str = "unified_entities.json") -> Path:
-    """Save entity database to JSON."""
+def save_entity_db(
+    entities: Dict[str, Entity],
+    filename: str = "unified_entities.json",
+    pretty: bool = False,
+) -> Path:
+    """
+    Save entity database to JSON.
+
+    orjson serializes the dataclasses directly in C - no to_dict() pass and
+    no pretty-printing by default, which matters once the DB reaches
+    hundreds of MB. Pass pretty=True when a human needs to read the file.
+    """
     path = CACHE_DIR / filename
-    data = {name: entity.to_dict() for name, entity in entities.items()}
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    path.write_bytes(orjson.dumps(entities, option=option))
     return path
 
 
@@ -102,33 +162,127 @@ def load_entity_db(filename: str = "unified_entities.json") -> Dict[str, Dict]:
     path = CACHE_DIR / filename
     if not path.exists():
         return {}
-    return json.loads(path.read_text(encoding="utf-8"))
+    return orjson.loads(path.read_bytes())
+
+
+def tune_sqlite_for_reads(conn) -> None:
+    """
+    Apply read-workload PRAGMAs to a sqlite3 connection.
+
+    The ingest databases are read-only scratch copies, so durability
+    settings can be dropped entirely; mmap plus a large page cache keeps
+    the big table scans off the syscall path.
+    """
+    conn.executescript(
+        "PRAGMA mmap_size=1073741824;"
+        "PRAGMA cache_size=-200000;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA synchronous=OFF;"
+    )
+
+
+def fetch_batches(conn, query: str, batch_size: int = 10000):
+    """
+    Yield lists of rows for a query via fetchmany.
+
+    Callers loop over each batch themselves; pulling 10k tuples per C call
+    and iterating a plain list beats the row-at-a-time cursor protocol.
+    """
+    cur = conn.execute(query)
+    cur.arraysize = batch_size
+    while rows := cur.fetchmany():
+        yield rows
+
+
+# Trust a cached artifact this long before revalidating it upstream
+REVALIDATE_AFTER = 86400  # 24 hours
 
+# One pooled client shared by every download in a run: the TLS handshake to
+# raw.githubusercontent.com is paid once instead of per file, and with h2
+# installed concurrent ingesters multiplex over the same connection.
+# Built lazily so importing this module never costs an httpx import.
+_http_client = None
 
-def download_file(url: str, dest: Path, chunk_size: int = 8192) -> Path:
-    """Download a file with progress, skipping if already cached."""
-    import requests
 
+def _get_http_client():
+    global _http_client
+    if _http_client is None:
+        import httpx
+
+        try:
+            import h2  # noqa: F401  # httpx needs the h2 package for HTTP/2
+            http2 = True
+        except ImportError:
+            http2 = False
+        _http_client = httpx.Client(http2=http2, timeout=300, follow_redirects=True)
+    return _http_client
+
+
+def download_file(url: str, dest: Path, chunk_size: int = 1 << 20, return_bytes: bool = False):
+    """
+    Download a file with progress, skipping if already cached.
+
+    Fresh cache hits (younger than REVALIDATE_AFTER) are served locally.
+    Older files with a stored ETag are revalidated with a conditional GET -
+    an unchanged upstream answers 304 with no body, so a no-change run
+    costs a couple hundred bytes per source. Files without an ETag sidecar
+    stay cached indefinitely, as before.
+
+    1MB chunks keep the Python loop out of the picture on multi-hundred-MB
+    artifacts, and the progress line prints at most once a second instead
+    of once per chunk.
+
+    With return_bytes=True the content just fetched (or cached) comes back
+    as bytes, so callers that parse the payload immediately skip the
+    write-then-re-read round trip through the filesystem. Only use it for
+    sources that fit in memory.
+
+    Returns:
+        dest (default), or the file content as bytes when return_bytes=True.
+    """
+    etag_path = dest.with_suffix(dest.suffix + ".etag")
+
+    headers = {}
     if dest.exists():
-        print(f"  Cached: {dest.name}")
-        return dest
+        etag = etag_path.read_text().strip() if etag_path.exists() else ""
+        if not etag or time.time() - dest.stat().st_mtime < REVALIDATE_AFTER:
+            print(f"  Cached: {dest.name}")
+            return dest.read_bytes() if return_bytes else dest
+        headers["If-None-Match"] = etag
+        print(f"  Revalidating: {dest.name}")
+    else:
+        print(f"  Downloading: {url}")
 
-    print(f"  Downloading: {url}")
     dest.parent.mkdir(parents=True, exist_ok=True)
 
-    resp = requests.get(url, stream=True, timeout=300)
-    resp.raise_for_status()
+    buf = bytearray() if return_bytes else None
+
+    with _get_http_client().stream("GET", url, headers=headers) as resp:
+        if resp.status_code == 304:
+            dest.touch()  # Restart the freshness window
+            print(f"  Not modified: {dest.name}")
+            return dest.read_bytes() if return_bytes else dest
+        resp.raise_for_status()
+
+        new_etag = resp.headers.get("etag", "")
+        total = int(resp.headers.get("content-length", 0))
+        downloaded = 0
+        last_print = 0.0
 
-    total = int(resp.headers.get("content-length", 0))
-    downloaded = 0
+        with open(dest, "wb") as f:
+            for chunk in resp.iter_bytes(chunk_size=chunk_size):
+                f.write(chunk)
+                if buf is not None:
+                    buf += chunk
+                downloaded += len(chunk)
+                now = time.monotonic()
+                if total and now - last_print >= 1.0:
+                    pct = (downloaded / total) * 100
+                    print(f"  {downloaded / 1_000_000:.1f} MB / {total / 1_000_000:.1f} MB ({pct:.0f}%)", end="\r")
+                    last_print = now
 
-    with open(dest, "wb") as f:
-        for chunk in resp.iter_content(chunk_size=chunk_size):
-            f.write(chunk)
-            downloaded += len(chunk)
-            if total:
-                pct = (downloaded / total) * 100
-                print(f"  {downloaded / 1_000_000:.1f} MB / {total / 1_000_000:.1f} MB ({pct:.0f}%)", end="\r")
+    if new_etag:
+        etag_path.write_text(new_etag)
 
     print(f"  Downloaded: {dest.name} ({downloaded / 1_000_000:.1f} MB)")
-    return dest
+    return bytes(buf) if return_bytes else dest
@@ -11,6 +11,11 @@ import json
 import io
 from typing import Dict
 
+try:
+    import ijson
+except ImportError:  # Graceful fallback to a full in-memory parse
+    ijson = None
+
 from pipeline.config import CACHE_DIR
 from pipeline.ingest.common import Entity, EntityConnection, download_file
 
@@ -24,14 +29,48 @@ CSV_URL = (
     "https://raw.githubusercontent.com/phelix001/epstein-network/main/dataset8_all_names.csv"
 )
 
-# Categories to skip (noise, not people)
-SKIP_CATEGORIES = {"unknown"}
+# Categories to skip (noise, not people). Entries are lowercase; compare
+# against a case-folded category so variant-cased source data can't slip past.
+SKIP_CATEGORIES = frozenset({"unknown"})
 
 # Known noise entries to filter out
-NOISE_NAMES = {
+NOISE_NAMES = frozenset({
     "new york", "palm beach", "florida", "normal attachments", "end date",
     "date created", "united states", "virgin islands", "little st. james",
-}
+})
+
+# The category vocabulary is tiny (see module docstring), so the
+# description suffix per category is formatted once and reused across the
+# tens of thousands of rows that share it. Unexpected categories are
+# memoized on first sight.
+KNOWN_CATEGORIES = (
+    "core", "accomplice", "victim", "political", "business", "legal/attorney",
+    "academic", "entertainment", "staff", "journalist", "unknown",
+)
+_CATEGORY_SUFFIX = {c: f" Category: {c}." for c in KNOWN_CATEGORIES}
+
+
+def _category_suffix(category: str) -> str:
+    suffix = _CATEGORY_SUFFIX.get(category)
+    if suffix is None:
+        suffix = _CATEGORY_SUFFIX[category] = f" Category: {category}."
+    return suffix
+
+
+def _iter_people(dest):
+    """
+    Yield (name, info) pairs from focused_entities.json.
+
+    ijson streams each entry off the file without ever holding the full
+    parse tree, which keeps peak memory flat on a multi-MB source; without
+    ijson installed this degrades to one json.loads of the whole file.
+    """
+    if ijson is not None:
+        with dest.open("rb") as f:
+            yield from ijson.kvitems(f, "people")
+    else:
+        data = json.loads(dest.read_text(encoding="utf-8"))
+        yield from data.get("people", {}).items()
 
 
 def ingest_focused_entities() -> Dict[str, Entity]:
@@ -42,20 +81,23 @@ def ingest_focused_entities() -> Dict[str, Entity]:
     dest = CACHE_DIR / "phelix_focused_entities.json"
     download_file(FOCUSED_ENTITIES_URL, dest)
 
-    data = json.loads(dest.read_text(encoding="utf-8"))
-    people = data.get("people", {})
-
     entities: Dict[str, Entity] = {}
 
-    for name, info in people.items():
-        name_lower = name.strip().lower()
-
-        # Skip noise entries
-        if name_lower in NOISE_NAMES:
-            continue
-
-        category = info.get("category", "unknown")
-        if category in SKIP_CATEGORIES:
+    # Local binds for the names hit on every one of the tens of thousands of
+    # iterations - global and attribute lookups add up in a loop this hot
+    _EntityConnection = EntityConnection
+    _source = SOURCE_NAME
+    noise_names = NOISE_NAMES
+    skip_categories = SKIP_CATEGORIES
+
+    for name, info in _iter_people(dest):
+        name = name.strip()
+        # Lower once here; the CSV fallback does the same, so both paths hit
+        # SKIP_CATEGORIES (and the category suffix cache) with one casing
+        category = info.get("category", "unknown").lower()
+
+        # Skip noise entries and non-person categories in one gate
+        if name.lower() in noise_names or category in skip_categories:
             continue
 
         count = info.get("count", 0)
@@ -65,36 +107,37 @@ def ingest_focused_entities() -> Dict[str, Entity]:
 
         # Build connection descriptions
         connections = []
+        append = connections.append
 
         # The entity's own document presence
         if doc_ids:
-            connections.append(EntityConnection(
-                description=f"Named in {len(doc_ids)} FOIA documents. Category: {category}."
+            append(_EntityConnection(
+                description=f"Named in {len(doc_ids)} FOIA documents."
+                + _category_suffix(category)
                 + (f" Role: {role}" if role else ""),
-                source_db=SOURCE_NAME,
-                document_ids=doc_ids[:20],  # Cap at 20 for efficiency
+                source_db=_source,
+                # Cap at 20 for efficiency; skip the slice copy when short
+                document_ids=doc_ids[:20] if len(doc_ids) > 20 else doc_ids,
                 evidence_type="document_mention",
             ))
 
         # Co-occurrence connections with other entities
         for connected_name, co_count in connections_raw.items():
             if co_count >= 3:  # Only meaningful co-occurrences
-                connections.append(EntityConnection(
+                append(_EntityConnection(
                     description=f"Co-occurs with {connected_name} in {co_count} documents",
-                    source_db=SOURCE_NAME,
+                    source_db=_source,
                     evidence_type="co_occurrence",
                 ))
 
-        entity = Entity(
-            name=name.strip(),
-            sources=[SOURCE_NAME],
+        entities[name] = Entity(
+            name=name,
+            sources=[_source],
             connections=connections,
             categories=[category],
             total_document_mentions=count,
         )
 
-        entities[name.strip()] = entity
-
     print(f"[phelix] Ingested {len(entities)} entities from focused_entities.json")
     return entities
 
@@ -105,34 +148,61 @@ def ingest_csv_fallback() -> Dict[str, Entity]:
     Less rich data but broader coverage.
     """
     dest = CACHE_DIR / "phelix_dataset8_all_names.csv"
-    download_file(CSV_URL, dest)
-
-    text = dest.read_text(encoding="utf-8")
-    reader = csv.DictReader(io.StringIO(text))
-
-    entities: Dict[str, Entity] = {}
+    text = download_file(CSV_URL, dest, return_bytes=True).decode("utf-8")
+
+    # csv.reader with positional access skips the per-row dict DictReader
+    # builds; the four column indices are resolved once from the header
+    reader = csv.reader(io.StringIO(text))
+    header = next(reader, None)
+    if not header:
+        print("[phelix] CSV fallback is empty")
+        return {}
+
+    i_name = header.index("Name")
+    i_cat = header.index("Category")
+    i_count = header.index("Mention Count")
+    i_files = header.index("Sample Files")
+    min_width = max(i_name, i_cat, i_count, i_files) + 1
+
+    # First pass: pick the winning row per name (CSV has some duplicate
+    # names; max mention count wins). Losing and filtered rows never get
+    # Entity/EntityConnection objects built for them. Locals for the hot
+    # lookups keep the scan free of repeated global loads.
+    best: Dict[str, tuple] = {}
+    best_get = best.get
+    noise_names = NOISE_NAMES
+    skip_categories = SKIP_CATEGORIES
 
     for row in reader:
-        name = row.get("Name", "").strip()
-        category = row.get("Category", "unknown").lower()
-        mention_count = int(row.get("Mention Count", 0))
-        sample_files = row.get("Sample Files", "")
+        if len(row) < min_width:
+            continue
+
+        name = row[i_name].strip()
+        category = row[i_cat].lower() or "unknown"
+        mention_count = int(row[i_count] or 0)
 
         name_lower = name.lower()
-        if name_lower in NOISE_NAMES or category in SKIP_CATEGORIES:
+        if name_lower in noise_names or category in skip_categories:
             continue
 
         if not name or mention_count < 2:
             continue
 
+        prev = best_get(name)
+        if prev is None or mention_count > prev[1]:
+            best[name] = (category, mention_count, row[i_files])
+
+    # Second pass: materialize only the winners
+    entities: Dict[str, Entity] = {}
+    for name, (category, mention_count, sample_files) in best.items():
         doc_ids = [d.strip() for d in sample_files.split(";") if d.strip()]
 
-        entity = Entity(
+        entities[name] = Entity(
             name=name,
             sources=[SOURCE_NAME],
             connections=[
                 EntityConnection(
-                    description=f"Named in {mention_count} FOIA documents. Category: {category}.",
+                    description=f"Named in {mention_count} FOIA documents." + _category_suffix(category),
                     source_db=SOURCE_NAME,
                     document_ids=doc_ids,
                     evidence_type="document_mention",
@@ -142,10 +212,6 @@ def ingest_csv_fallback() -> Dict[str, Entity]:
             total_document_mentions=mention_count,
         )
 
-        # Deduplicate (CSV has some duplicate names)
-        if name not in entities or mention_count > entities[name].total_document_mentions:
-            entities[name] = entity
-
     print(f"[phelix] Ingested {len(entities)} entities from CSV fallback")
     return entities
 
@@ -5,9 +5,10 @@ Source: JSON data files from the GitHub repo.
 This project has 68,798 documents with NER-extracted entities,
 16,169 financial transactions, and timeline events.
 """
-import json
 from typing import Dict
 
+import orjson
+
 from pipeline.config import CACHE_DIR
 from pipeline.ingest.common import Entity, EntityConnection, download_file
 
@@ -25,15 +26,18 @@ FINANCIAL_DATA_URLS = [
     "https://raw.githubusercontent.com/SvetimFM/epstein-files-visualizations/main/financial_transactions.json",
 ]
 
+# Keys a transaction might use for its parties, in precedence order
+PARTY_KEYS = ("from", "to", "sender", "recipient", "party")
+
 
 def _try_download(urls: list, dest_name: str) -> dict | list | None:
     """Try downloading from multiple possible URLs."""
     for url in urls:
         dest = CACHE_DIR / dest_name
         try:
-            download_file(url, dest)
-            data = json.loads(dest.read_text(encoding="utf-8"))
-            return data
+            # orjson parses the raw bytes in C - no UTF-8 decode pass and
+            # several times faster than the stdlib on these multi-MB files
+            return orjson.loads(download_file(url, dest, return_bytes=True))
         except Exception:
             dest.unlink(missing_ok=True)
             continue
@@ -127,31 +131,40 @@ def ingest() -> Dict[str, Entity]:
 
     if financial_data and isinstance(financial_data, list):
         for txn in financial_data:
-            for party_key in ["from", "to", "sender", "recipient", "party"]:
-                party = txn.get(party_key, "").strip()
-                if party and len(party) >= 3:
-                    amount = txn.get("amount", txn.get("value", ""))
-                    purpose = txn.get("purpose", txn.get("description", ""))
-                    doc_id = txn.get("document_id", txn.get("doc_id", ""))
-
-                    conn = EntityConnection(
-                        description=f"Financial transaction: {purpose}. Amount: {amount}",
-                        source_db=SOURCE_NAME,
-                        document_ids=[doc_id] if doc_id else [],
-                        evidence_type="financial_transaction",
+            # Resolve the valid parties first; transaction fields and the
+            # shared connection record are only built when there is at
+            # least one, and once per transaction rather than per party
+            parties = [
+                party
+                for key in PARTY_KEYS
+                if len(party := txn.get(key, "").strip()) >= 3
+            ]
+            if not parties:
+                continue
+
+            amount = txn.get("amount", txn.get("value", ""))
+            purpose = txn.get("purpose", txn.get("description", ""))
+            doc_id = txn.get("document_id", txn.get("doc_id", ""))
+
+            conn = EntityConnection(
+                description=f"Financial transaction: {purpose}. Amount: {amount}",
+                source_db=SOURCE_NAME,
+                document_ids=[doc_id] if doc_id else [],
+                evidence_type="financial_transaction",
+            )
+
+            for party in parties:
+                if party in entities:
+                    entities[party].connections.append(conn)
+                else:
+                    entities[party] = Entity(
+                        name=party,
+                        sources=[SOURCE_NAME],
+                        connections=[conn],
+                        categories=["financial"],
+                        total_document_mentions=1,
                     )
 
-                    if party in entities:
-                        entities[party].connections.append(conn)
-                    else:
-                        entities[party] = Entity(
-                            name=party,
-                            sources=[SOURCE_NAME],
-                            connections=[conn],
-                            categories=["financial"],
-                            total_document_mentions=1,
-                        )
-
     if not entities:
         print(f"[svetimfm] WARNING: Could not load data from any known URL. "
               f"Repository structure may have changed.")
@@ -3,15 +3,32 @@ Generate static JSON files for the frontend.
 These files are committed to the repo and served as static data by Vercel.
 No runtime API calls needed from the frontend.
 """
-import json
 from pathlib import Path
 from typing import Dict, List
 
+import orjson
+
 from pipeline.config import DATA_DIR
-from pipeline.candidates.merge import build_candidate_id
+from pipeline.candidates.merge import build_candidate_id, build_candidate_key
 from pipeline.classify.citations import generate_citation, generate_clean_citation
 
 
+# Shared fallback for candidates with no classification on file; module-level
+# so a miss doesn't allocate a fresh default dict per connection.
+_DEFAULT_CLASS = {"level": "Contact", "reasoning": ""}
+
+
+def _write_json(path: Path, obj) -> Path:
+    """Serialize obj to path with orjson, indented.
+
+    These files are committed to the repo, so the indent stays for
+    reviewable diffs; orjson still writes them several times faster than
+    the stdlib and emits bytes directly.
+    """
+    path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    return path
+
+
 def publish_candidates(candidates: List[Dict]) -> Path:
     """
     Write candidates.json with all candidates and their district assignments.
@@ -34,9 +51,7 @@ def publish_candidates(candidates: List[Dict]) -> Path:
             "incumbent": c.get("incumbent", False),
         })
 
-    path = DATA_DIR / "candidates.json"
-    path.write_text(json.dumps(output, indent=2), encoding="utf-8")
-    return path
+    return _write_json(DATA_DIR / "candidates.json", output)
 
 
 def publish_connections(
@@ -55,42 +70,56 @@ def publish_connections(
     Returns:
         Path to written file
     """
-    output = {}
-
-    for candidate in candidates:
-        cid = build_candidate_id(candidate)
-        candidate_key = f"{candidate['name']}|{candidate.get('state', '')}|{candidate.get('office', '')}"
-
-        conn_data = filtered_connections.get(candidate_key, {"has_connections": False, "connections": []})
-
-        if conn_data["has_connections"]:
-            # Build citations for each connection
-            citations = []
-            for conn in conn_data["connections"]:
-                classification = classifications.get(candidate_key, {"level": "Contact", "reasoning": ""})
-
-                citation = generate_citation(
-                    person_name=candidate["name"],
-                    connection_level=classification["level"],
-                    confidence=conn["confidence"],
-                    num_sources=conn["num_sources"],
-                    evidence=conn["entity_data"].get("connections", []),
-                    caveat=conn.get("caveat"),
-                )
-                citations.append(citation)
-
-            output[cid] = {
-                "has_connections": True,
-                "citations": citations,
-            }
-        else:
-            output[cid] = {
-                "has_connections": False,
-                "citations": [generate_clean_citation(candidate["name"])],
-            }
-
+    # connections.json is the big one (every candidate, every citation), so
+    # it's streamed entry by entry instead of assembling one giant dict and
+    # serializing it in a single pass - peak memory stays at one candidate's
+    # entry regardless of how many candidates there are.
     path = DATA_DIR / "connections.json"
-    path.write_text(json.dumps(output, indent=2), encoding="utf-8")
+    with open(path, "wb") as f:
+        f.write(b"{\n")
+        first = True
+
+        for candidate in candidates:
+            cid = build_candidate_id(candidate)
+            candidate_key = build_candidate_key(candidate)
+
+            conn_data = filtered_connections.get(candidate_key, {"has_connections": False, "connections": []})
+
+            if conn_data["has_connections"]:
+                # The classification depends only on the candidate, so look
+                # it up once rather than per connection
+                classification = classifications.get(candidate_key, _DEFAULT_CLASS)
+
+                # Build citations for each connection
+                citations = []
+                for conn in conn_data["connections"]:
+                    citation = generate_citation(
+                        person_name=candidate["name"],
+                        connection_level=classification["level"],
+                        confidence=conn["confidence"],
+                        num_sources=conn["num_sources"],
+                        evidence=conn["entity_data"].get("connections", []),
+                        caveat=conn.get("caveat"),
+                    )
+                    citations.append(citation)
+
+                entry = {
+                    "has_connections": True,
+                    "citations": citations,
+                }
+            else:
+                entry = {
+                    "has_connections": False,
+                    "citations": [generate_clean_citation(candidate["name"])],
+                }
+
+            if not first:
+                f.write(b",\n")
+            f.write(orjson.dumps(cid) + b": " + orjson.dumps(entry, option=orjson.OPT_INDENT_2))
+            first = False
+
+        f.write(b"\n}\n")
+
     return path
 
 
@@ -104,9 +133,61 @@ def publish_districts(district_mapping: Dict[str, Dict]) -> Path:
     Returns:
         Path to written file
     """
-    path = DATA_DIR / "districts.json"
-    path.write_text(json.dumps(district_mapping, indent=2), encoding="utf-8")
-    return path
+    return _write_json(DATA_DIR / "districts.json", district_mapping)
+
+
+# Everything in metadata.json except last_updated is a constant, so the
+# template lives at module level and its JSON is rendered once at import;
+# publishing just splices a fresh timestamp in front of the cached tail.
+_METADATA_STATIC = {
+    "data_sources": [
+        {
+            "name": "DOJ Epstein Library",
+            "url": "https://www.justice.gov/epstein",
+            "description": "3.5 million pages released January 30, 2026",
+        },
+        {
+            "name": "Epstein Doc Explorer",
+            "url": "https://github.com/maxandrews/Epstein-doc-explorer",
+            "description": "15,000+ relationships extracted from email corpus",
+        },
+        {
+            "name": "LMSBAND Epstein Files DB",
+            "url": "https://github.com/LMSBAND/epstein-files-db",
+            "description": "NER entities from DOJ Datasets 8-12",
+        },
+        {
+            "name": "SvetimFM Entity Analysis",
+            "url": "https://github.com/SvetimFM/epstein-files-visualizations",
+            "description": "68,798 documents with entity networks",
+        },
+        {
+            "name": "phelix001 Epstein Network",
+            "url": "https://github.com/phelix001/epstein-network",
+            "description": "19,154 FOIA documents with categorized entities",
+        },
+        {
+            "name": "ProPublica Congress API",
+            "url": "https://www.propublica.org/datastore/api/propublica-congress-api",
+            "description": "Current federal legislators",
+        },
+        {
+            "name": "FEC API",
+            "url": "https://api.open.fec.gov/developers/",
+            "description": "Filed federal candidates",
+        },
+    ],
+    "methodology": {
+        "min_sources_to_display": 2,
+        "fuzzy_match_threshold": 92,
+        "ai_disambiguation": True,
+        "connection_levels": ["Direct", "Contact", "Financial", "Institutional"],
+    },
+}
+
+# The serialized template minus its opening brace; a timestamped prefix is
+# prepended per run to reconstitute the full object
+_METADATA_TAIL = orjson.dumps(_METADATA_STATIC, option=orjson.OPT_INDENT_2)[1:]
 
 
 def publish_metadata() -> Path:
@@ -115,53 +196,7 @@ def publish_metadata() -> Path:
     """
     from datetime import datetime, timezone
 
-    metadata = {
-        "last_updated": datetime.now(timezone.utc).isoformat(),
-        "data_sources": [
-            {
-                "name": "DOJ Epstein Library",
-                "url": "https://www.justice.gov/epstein",
-                "description": "3.5 million pages released January 30, 2026",
-            },
-            {
-                "name": "Epstein Doc Explorer",
-                "url": "https://github.com/maxandrews/Epstein-doc-explorer",
-                "description": "15,000+ relationships extracted from email corpus",
-            },
-            {
-                "name": "LMSBAND Epstein Files DB",
-                "url": "https://github.com/LMSBAND/epstein-files-db",
-                "description": "NER entities from DOJ Datasets 8-12",
-            },
-            {
-                "name": "SvetimFM Entity Analysis",
-                "url": "https://github.com/SvetimFM/epstein-files-visualizations",
-                "description": "68,798 documents with entity networks",
-            },
-            {
-                "name": "phelix001 Epstein Network",
-                "url": "https://github.com/phelix001/epstein-network",
-                "description": "19,154 FOIA documents with categorized entities",
-            },
-            {
-                "name": "ProPublica Congress API",
-                "url": "https://www.propublica.org/datastore/api/propublica-congress-api",
-                "description": "Current federal legislators",
-            },
-            {
-                "name": "FEC API",
-                "url": "https://api.open.fec.gov/developers/",
-                "description": "Filed federal candidates",
-            },
-        ],
-        "methodology": {
-            "min_sources_to_display": 2,
-            "fuzzy_match_threshold": 92,
-            "ai_disambiguation": True,
-            "connection_levels": ["Direct", "Contact", "Financial", "Institutional"],
-        },
-    }
-
+    stamp = orjson.dumps(datetime.now(timezone.utc).isoformat())
     path = DATA_DIR / "metadata.json"
-    path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    path.write_bytes(b'{\n  "last_updated": ' + stamp + b"," + _METADATA_TAIL)
     return path
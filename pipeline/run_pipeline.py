@@ -10,6 +10,7 @@ Usage:
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from pipeline.config import CACHE_DIR, DATA_DIR
@@ -34,15 +35,20 @@ def run_ingest():
         ("svetimfm", svetimfm),
     ]
 
-    for name, module in modules:
-        try:
-            print(f"\n--- Ingesting from {name} ---")
-            db = module.ingest()
-            databases.append(db)
-            print(f"  -> {len(db)} entities")
-        except Exception as e:
-            print(f"  -> FAILED: {e}")
-            # Continue with other sources - partial data is better than none
+    # Each source is download + parse bound, so all four run concurrently;
+    # results are collected in submission order to keep merge precedence
+    # deterministic (same pattern as the candidate source fetches)
+    print(f"\n--- Ingesting from {', '.join(name for name, _ in modules)} ---")
+    with ThreadPoolExecutor(max_workers=len(modules)) as pool:
+        futures = [(name, pool.submit(module.ingest)) for name, module in modules]
+        for name, future in futures:
+            try:
+                db = future.result()
+                databases.append(db)
+                print(f"  -> {name}: {len(db)} entities")
+            except Exception as e:
+                print(f"  -> {name} FAILED: {e}")
+                # Continue with other sources - partial data is better than none
 
     if not databases:
         print("\nERROR: No databases could be ingested. Aborting.")
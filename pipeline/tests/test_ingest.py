@@ -39,7 +39,7 @@ class TestEntityMerge:
 
         # Should have one entry (merged)
         assert len(merged) == 1
-        entity = list(merged.values())[0]
+        entity = next(iter(merged.values()))
         assert set(entity.sources) == {"source_a", "source_b"}
         assert len(entity.connections) == 2
         assert set(entity.categories) == {"political", "business"}
@@ -66,7 +66,7 @@ class TestEntityMerge:
 
         merged = merge_entity_databases(db1, db2)
         assert len(merged) == 1
-        entity = list(merged.values())[0]
+        entity = next(iter(merged.values()))
         assert len(entity.sources) == 2
         # One of the names should be an alias
         assert "William Smith" in entity.aliases or "Bill Smith" in entity.aliases
@@ -100,7 +100,7 @@ class TestEntityMerge:
         db3 = {"Test Person": Entity(name="Test Person", sources=["c"], connections=[], total_document_mentions=3)}
 
         merged = merge_entity_databases(db1, db2, db3)
-        entity = list(merged.values())[0]
+        entity = next(iter(merged.values()))
         assert len(entity.sources) == 3
         assert entity.total_document_mentions == 6
 
@@ -123,7 +123,7 @@ class TestEntityMerge:
         db2 = {"Test": Entity(name="Test", sources=["source_a"], connections=[], total_document_mentions=2)}
 
         merged = merge_entity_databases(db1, db2)
-        entity = list(merged.values())[0]
+        entity = next(iter(merged.values()))
         assert entity.sources == ["source_a"]  # Not ["source_a", "source_a"]
 
     def test_merge_with_titles(self):
@@ -147,9 +147,56 @@ class TestEntityMerge:
 
         merged = merge_entity_databases(db1, db2)
         assert len(merged) == 1
-        entity = list(merged.values())[0]
+        entity = next(iter(merged.values()))
         assert len(entity.sources) == 2
 
+    def test_merge_keeps_different_middle_names_separate(self):
+        """Same first+last but conflicting middle names are different people."""
+        db1 = {
+            "James Edward Smith": Entity(
+                name="James Edward Smith",
+                sources=["a"],
+                connections=[],
+                total_document_mentions=1,
+            )
+        }
+        db2 = {
+            "James Alan Smith": Entity(
+                name="James Alan Smith",
+                sources=["b"],
+                connections=[],
+                total_document_mentions=1,
+            )
+        }
+
+        merged = merge_entity_databases(db1, db2)
+        assert len(merged) == 2
+        for entity in merged.values():
+            assert len(entity.sources) == 1
+
+    def test_merge_is_exact_on_normalized_form(self):
+        """A middle name is not dropped to force a merge - that judgment is
+        left to the AI disambiguation path, which sees the evidence."""
+        db1 = {
+            "William Jefferson Clinton": Entity(
+                name="William Jefferson Clinton",
+                sources=["a"],
+                connections=[],
+                total_document_mentions=1,
+            )
+        }
+        db2 = {
+            "William Clinton": Entity(
+                name="William Clinton",
+                sources=["b"],
+                connections=[],
+                total_document_mentions=1,
+            )
+        }
+
+        merged = merge_entity_databases(db1, db2)
+        assert len(merged) == 2
+
 
 class TestEntityToDict:
     """Test serialization."""